@@ -93,6 +93,12 @@ setup(
             'cchardet>=2.1.7',  # Detector de encoding mais rápido
             'ujson>=5.7.0',     # JSON parser mais rápido
         ],
+        'fast': [
+            'selectolax>=0.3.17',     # Parser CSS em C (paginação InovaWeek, listagem UVV)
+            'brotli>=1.1.0',          # Accept-Encoding 'br' nos scrapers UVV
+            'requests-cache>=1.1.0',  # Cache HTTP em disco no scraper de notícias UVV
+            'orjson>=3.9.0',          # JSON de saída UVV e checkpoint InovaWeek
+        ],
     },
     
     # === SCRIPTS E ENTRY POINTS ===
@@ -21,12 +21,13 @@ Data: 26/09/2025
 import sys
 import os
 import time
+import logging
 from datetime import datetime
 
 # Adicionar o diretório pai ao path para importar o scraper
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scrapers.scraper_uvv_inovaweek_revisado import UVVInovaWeekScraper, CacheManager
+from scrapers.scraper_uvv_inovaweek_revisado import UVVInovaWeekScraper, CacheManager, configurar_logging
 
 def demonstracao_basica():
     """Demonstra o funcionamento básico do cache"""
@@ -260,9 +261,13 @@ def executar_scraper_real():
         print(f"❌ Erro durante coleta: {e}")
 
 if __name__ == "__main__":
+    # Nível DEBUG para exibir os logs de Cache HIT/304 de cada requisição
+    listener_log = configurar_logging(logging.DEBUG)
     try:
         menu_interativo()
     except KeyboardInterrupt:
         print("\n\n👋 Demonstração finalizada.")
     except Exception as e:
-        print(f"\n❌ Erro inesperado: {e}")
\ No newline at end of file
+        print(f"\n❌ Erro inesperado: {e}")
+    finally:
+        listener_log.stop()
\ No newline at end of file
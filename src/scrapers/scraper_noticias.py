@@ -46,6 +46,15 @@ import csv                     # Módulo para manipulação de arquivos CSV
 import time                    # Controle de delay e timing
 from datetime import datetime  # Manipulação de datas e timestamps
 
+# === PARSER HTML ===
+# lxml (libxml2, em C) quando instalado, com fallback para o html.parser
+# da biblioteca padrão (Python puro, bem mais lento em páginas grandes)
+try:
+    import lxml  # noqa: F401
+    _PARSER_HTML = 'lxml'
+except ImportError:
+    _PARSER_HTML = 'html.parser'
+
 class NoticiasScraper:
     """
     Classe principal para scraping profissional de notícias
@@ -149,7 +158,7 @@ class NoticiasScraper:
             
             return None
     
-    def extrair_noticias_exemplo(self, html_content):
+    def extrair_noticias_exemplo(self, html_content, encoding=None):
         """
         Extrai notícias usando estratégia de seletores múltiplos
         
@@ -158,7 +167,8 @@ class NoticiasScraper:
         de estruturação de conteúdo HTML.
         
         Args:
-            html_content (str): Conteúdo HTML bruto da página
+            html_content (str or bytes): Conteúdo HTML bruto da página
+            encoding (str): Encoding do HTML quando passado em bytes (opcional)
         
         Returns:
             list: Lista de dicionários com dados das notícias extraídas
@@ -176,7 +186,9 @@ class NoticiasScraper:
         4. Campos adicionais específicos do site
         """
         # === PARSING DO CONTEÚDO HTML ===
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _PARSER_HTML, from_encoding=encoding)
+        # from_encoding: com bytes e encoding conhecido, o BeautifulSoup não
+        # precisa adivinhar a codificação (ignorado quando recebe str)
         
         # === LISTA ACUMULADORA DE RESULTADOS ===
         manchetes = []
@@ -296,8 +308,9 @@ class NoticiasScraper:
             return []
         
         # === EXTRAÇÃO DE DADOS ESTRUTURADOS ===
-        noticias = self.extrair_noticias_exemplo(response.text)
-        # response.text contém o HTML completo da página
+        noticias = self.extrair_noticias_exemplo(response.content, encoding=response.encoding)
+        # response.content contém o HTML completo da página em bytes; o parser
+        # decodifica direto com o encoding da resposta (sem decodificar duas vezes)
         # extrair_noticias_exemplo() processa e estrutura os dados
         
         # === LOG DE RESULTADOS ===
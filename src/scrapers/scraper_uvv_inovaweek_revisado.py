@@ -24,8 +24,13 @@ Foco: Notícias do InovaWeek
 
 # === IMPORTAÇÕES NECESSÁRIAS ===
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import csv
-from bs4 import BeautifulSoup
+import codecs
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+import soupsieve as sv
 import time
 import re
 import json
@@ -37,7 +42,171 @@ from typing import Dict, Optional, List, Tuple
 import os
 import argparse
 import sys
-from collections import defaultdict
+import threading
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+# Parser do BeautifulSoup: lxml (libxml2, em C) quando instalado, com
+# fallback para o html.parser da biblioteca padrão
+try:
+    import lxml  # noqa: F401
+    _PARSER_HTML = 'lxml'
+except ImportError:
+    _PARSER_HTML = 'html.parser'
+
+# selectolax (lexbor, em C) é opcional: quando instalado, acelera a busca de
+# links de paginação; sem ele o BeautifulSoup continua sendo usado
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson (em Rust) é opcional: quando instalado, as linhas do checkpoint
+# JSONL são geradas e lidas por ele; sem ele, json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Elementos estruturais removidos das páginas de notícia individuais
+_ESTRUTURA_SELETOR = sv.compile('nav, header, footer, aside, .menu, .navigation')
+
+# Logger do módulo: mensagens por requisição/container saem por aqui em vez
+# de print(), podendo ser filtradas por nível sem custo de formatação
+logger = logging.getLogger(__name__)
+
+# Blocos <script>/<style> removidos do HTML antes do parsing: não têm
+# conteúdo útil e costumam ser a maior parte das páginas do CMS da UVV
+_SCRIPT_STYLE_RE = re.compile(rb'<(script|style)\b[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+# Palavras típicas de navegação da UVV
+_PALAVRAS_NAVEGACAO = (
+    'institucional', 'graduação', 'pós graduação', 'mestrado',
+    'doutorado', 'pesquisa', 'extensão', 'contato', 'blog',
+    'notícias', 'eventos', 'portal', 'trabalhe conosco'
+)
+_NAVEGACAO_RE = re.compile('|'.join(map(re.escape, _PALAVRAS_NAVEGACAO)))
+
+# Palavras que indicam um container de notícia relevante na listagem
+_PALAVRAS_CONTAINER_RE = re.compile(r'inovaweek|inova|setembro|agosto', re.IGNORECASE)
+
+# Número da página em links de paginação (/page/3/ ou ?page=3)
+_NUMERO_PAGINA_RE = re.compile(r'page[/=](\d+)')
+
+# Só as âncoras com número de página são materializadas ao verificar a
+# paginação (as demais não contribuíam para a contagem)
+_PAGINACAO_STRAINER = SoupStrainer('a', href=_NUMERO_PAGINA_RE)
+
+# Normalização de espaços do conteúdo exportado para CSV
+_LINHAS_VAZIAS_RE = re.compile(r'\n\s*\n')
+_ESPACOS_RE = re.compile(r'\s+')
+
+# Caracteres de controle removidos do CSV via str.translate (mantém \t e \n)
+_TABELA_CONTROLE = dict.fromkeys(c for c in range(32) if c not in (9, 10))
+
+# Padrões de data em português
+_PADROES_DATA = [
+    (re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})'), 'dd/mm/yyyy'),
+    (re.compile(r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})'), 'yyyy/mm/dd'),
+    (re.compile(r'(\d{1,2}) de (\w+) de (\d{4})'), 'dd de mês de yyyy'),
+    (re.compile(r'(\d{1,2}) (\w+) (\d{4})'), 'dd mês yyyy'),
+    (re.compile(r'(\w+) (\d{1,2}), (\d{4})'), 'mês dd, yyyy'),
+    (re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})'), 'dd/mm/yy')
+]
+
+# Mapeamento de meses em português
+_MESES_PT = {
+    'janeiro': 1, 'jan': 1,
+    'fevereiro': 2, 'fev': 2,
+    'março': 3, 'mar': 3,
+    'abril': 4, 'abr': 4,
+    'maio': 5, 'mai': 5,
+    'junho': 6, 'jun': 6,
+    'julho': 7, 'jul': 7,
+    'agosto': 8, 'ago': 8,
+    'setembro': 9, 'set': 9,
+    'outubro': 10, 'out': 10,
+    'novembro': 11, 'nov': 11,
+    'dezembro': 12, 'dez': 12
+}
+
+
+def _parse_data_iso(valor: str) -> Optional[datetime]:
+    """
+    Converte o atributo HTML5 datetime (ISO 8601) em datetime sem fuso.
+    
+    Args:
+        valor (str): Valor do atributo, ex.: '2025-09-15T10:00:00-03:00'
+        
+    Returns:
+        datetime or None: Data no horário local do site ou None se inválida
+    """
+    valor = valor.strip()
+    if valor[-1:] in ('Z', 'z'):
+        valor = valor[:-1] + '+00:00'
+    
+    try:
+        data_obj = datetime.fromisoformat(valor)
+    except ValueError:
+        return None
+    
+    # Remover o fuso para comparar com o período (datas sem fuso)
+    return data_obj.replace(tzinfo=None)
+
+
+@lru_cache(maxsize=1024)
+def _parse_data_texto(texto: str) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    Procura uma data em texto livre usando os padrões em português.
+    
+    Memoizado: o mesmo texto de data se repete entre containers e páginas.
+    
+    Args:
+        texto (str): Texto onde procurar a data
+        
+    Returns:
+        tuple: (datetime object, trecho encontrado) ou (None, None)
+    """
+    texto = texto.strip().lower()
+    
+    for padrao, formato in _PADROES_DATA:
+        match = padrao.search(texto)
+        if match:
+            try:
+                grupos = match.groups()
+                
+                if formato == 'dd/mm/yyyy':
+                    dia, mes, ano = map(int, grupos)
+                elif formato == 'yyyy/mm/dd':
+                    ano, mes, dia = map(int, grupos)
+                elif formato in ['dd de mês de yyyy', 'dd mês yyyy']:
+                    dia, nome_mes, ano = grupos
+                    dia, ano = int(dia), int(ano)
+                    mes = _MESES_PT.get(nome_mes)  # texto já em minúsculas
+                    if not mes:
+                        continue
+                elif formato == 'mês dd, yyyy':
+                    nome_mes, dia, ano = grupos
+                    dia, ano = int(dia), int(ano)
+                    mes = _MESES_PT.get(nome_mes)
+                    if not mes:
+                        continue
+                elif formato == 'dd/mm/yy':
+                    dia, mes, ano = map(int, grupos)
+                    ano = 2000 + ano if ano < 50 else 1900 + ano
+                
+                # Validar data
+                data_obj = datetime(ano, mes, dia)
+                return data_obj, match.group(0)
+                
+            except (ValueError, TypeError):
+                continue
+    
+    return None, None
 
 class CacheManager:
     """
@@ -48,6 +217,7 @@ class CacheManager:
     - Hash das URLs para identificação única
     - Compressão automática dos dados
     - Limpeza automática de cache expirado
+    - Validadores HTTP (ETag/Last-Modified) para requisições condicionais
     - Estatísticas de hit/miss do cache
     """
     
@@ -61,7 +231,7 @@ class CacheManager:
         """
         self.cache_dir = cache_dir
         self.expiration_time = timedelta(hours=expiration_hours)
-        self.stats = {"hits": 0, "misses": 0, "saves": 0}
+        self.stats = {"hits": 0, "misses": 0, "saves": 0, "revalidated": 0}
         
         # Criar diretório de cache se não existir
         os.makedirs(cache_dir, exist_ok=True)
@@ -98,6 +268,18 @@ class CacheManager:
         """
         return os.path.join(self.cache_dir, f"{cache_key}.cache")
     
+    def _get_validators_path(self, cache_key: str) -> str:
+        """
+        Retorna caminho do arquivo de validadores HTTP
+        
+        Args:
+            cache_key: Chave do cache
+            
+        Returns:
+            Caminho completo do arquivo
+        """
+        return os.path.join(self.cache_dir, f"{cache_key}.etag")
+    
     def _is_cache_valid(self, cache_path: str) -> bool:
         """
         Verifica se o cache ainda é válido (não expirado)
@@ -138,7 +320,7 @@ class CacheManager:
                     self.stats["hits"] += 1
                     return cached_data
             except Exception as e:
-                print(f"⚠️ Erro ao ler cache: {e}")
+                logger.warning("⚠️ Erro ao ler cache: %s", e)
         
         self.stats["misses"] += 1
         return None
@@ -173,9 +355,108 @@ class CacheManager:
             return True
             
         except Exception as e:
-            print(f"⚠️ Erro ao salvar cache: {e}")
+            logger.warning("⚠️ Erro ao salvar cache: %s", e)
+            return False
+    
+    def get_validators(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """
+        Busca validadores HTTP (ETag/Last-Modified) de uma resposta anterior.
+        
+        Os validadores não expiram junto com o cache: servem justamente
+        para revalidar uma resposta expirada com uma requisição condicional.
+        Só são devolvidos enquanto a entrada principal existir em disco, pois
+        é dela que sai o corpo reaproveitado num 304.
+        
+        Args:
+            url: URL da requisição
+            params: Parâmetros da requisição
+            
+        Returns:
+            Dict com 'etag' e 'last_modified' ou None se não houver
+        """
+        cache_key = self._get_cache_key(url, params)
+        validators_path = self._get_validators_path(cache_key)
+        
+        if not os.path.exists(validators_path):
+            return None
+        
+        if not os.path.exists(self._get_cache_path(cache_key)):
+            # Entrada principal já removida: validadores sem corpo não servem
+            self._remove_file(validators_path)
+            return None
+        
+        try:
+            with open(validators_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("⚠️ Erro ao ler validadores: %s", e)
+            return None
+    
+    def set_validators(self, url: str, etag: Optional[str], last_modified: Optional[str],
+                       params: Dict = None) -> bool:
+        """
+        Salva os validadores HTTP de uma resposta (sem o corpo)
+        
+        Args:
+            url: URL da requisição
+            etag: Valor do header ETag
+            last_modified: Valor do header Last-Modified
+            params: Parâmetros da requisição
+            
+        Returns:
+            True se salvou com sucesso
+        """
+        try:
+            validators_path = self._get_validators_path(self._get_cache_key(url, params))
+            
+            validators = {
+                'etag': etag,
+                'last_modified': last_modified
+            }
+            
+            with open(validators_path, 'wb') as f:
+                pickle.dump(validators, f)
+            
+            return True
+            
+        except Exception as e:
+            logger.warning("⚠️ Erro ao salvar validadores: %s", e)
             return False
     
+    def get_stale(self, url: str, params: Dict = None) -> Optional[Dict]:
+        """
+        Busca a entrada principal do cache mesmo que já tenha expirado
+        
+        Usado para reconstruir a resposta quando o servidor confirma com 304
+        que o conteúdo não mudou.
+        
+        Args:
+            url: URL da requisição
+            params: Parâmetros da requisição
+            
+        Returns:
+            Dados do cache ou None se a entrada não existir
+        """
+        cache_path = self._get_cache_path(self._get_cache_key(url, params))
+        
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("⚠️ Erro ao ler cache: %s", e)
+            return None
+    
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        """Remove um arquivo do cache, ignorando se já não existir."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    
     def _clean_expired_cache(self) -> int:
         """
         Remove arquivos de cache expirados
@@ -191,9 +472,11 @@ class CacheManager:
                     cache_path = os.path.join(self.cache_dir, filename)
                     if not self._is_cache_valid(cache_path):
                         os.remove(cache_path)
+                        # Validadores da entrada removida não têm mais corpo
+                        self._remove_file(cache_path[:-len('.cache')] + '.etag')
                         removed_count += 1
         except Exception as e:
-            print(f"⚠️ Erro ao limpar cache: {e}")
+            logger.warning("⚠️ Erro ao limpar cache: %s", e)
         
         return removed_count
     
@@ -208,11 +491,11 @@ class CacheManager:
         
         try:
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
+                if filename.endswith(('.cache', '.etag')):
                     os.remove(os.path.join(self.cache_dir, filename))
                     removed_count += 1
         except Exception as e:
-            print(f"⚠️ Erro ao limpar cache: {e}")
+            logger.warning("⚠️ Erro ao limpar cache: %s", e)
         
         return removed_count
     
@@ -230,6 +513,7 @@ class CacheManager:
             "hits": self.stats["hits"],
             "misses": self.stats["misses"], 
             "saves": self.stats["saves"],
+            "revalidated": self.stats["revalidated"],
             "total_requests": total_requests,
             "hit_rate_percent": round(hit_rate, 2),
             "cache_size_mb": self._get_cache_size()
@@ -245,7 +529,7 @@ class CacheManager:
         total_size = 0
         try:
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.cache'):
+                if filename.endswith(('.cache', '.etag')):
                     filepath = os.path.join(self.cache_dir, filename)
                     total_size += os.path.getsize(filepath)
         except Exception:
@@ -254,6 +538,52 @@ class CacheManager:
         return round(total_size / (1024 * 1024), 2)
 
 
+class RateLimiter:
+    """
+    ⏱️ Limitador de taxa (token bucket) compartilhado entre threads
+    
+    Cada requisição de rede consome um token; os tokens são repostos à taxa
+    configurada. Substitui as pausas fixas (time.sleep) entre requisições:
+    o ritmo é respeitado mesmo com várias threads buscando em paralelo, e
+    respostas vindas do cache não consomem tokens.
+    """
+    
+    def __init__(self, requisicoes_por_segundo: float, capacidade: int = 1):
+        """
+        Inicializa o limitador
+        
+        Args:
+            requisicoes_por_segundo: Taxa de reposição dos tokens
+            capacidade: Máximo de requisições liberadas em rajada (padrão: 1)
+        """
+        self.taxa = requisicoes_por_segundo
+        self.capacidade = capacidade
+        self._tokens = float(capacidade)
+        self._ultima_reposicao = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Bloqueia até haver um token disponível e o consome.
+        """
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self._tokens = min(
+                    self.capacidade,
+                    self._tokens + (agora - self._ultima_reposicao) * self.taxa
+                )
+                self._ultima_reposicao = agora
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                espera = (1 - self._tokens) / self.taxa
+            
+            time.sleep(espera)
+
+
 class UVVInovaWeekScraper:
     """
     Scraper especializado para notícias do InovaWeek da UVV.
@@ -262,8 +592,17 @@ class UVVInovaWeekScraper:
     com verificações robustas de tags CSS e extração precisa de dados.
     """
     
+    # Estratégia de retry com backoff, compartilhada entre instâncias
+    # (Retry é imutável: cada tentativa gera um novo objeto via increment())
+    RETRY_STRATEGY = Retry(
+        total=3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        backoff_factor=1,
+        raise_on_status=False
+    )
+    
     def __init__(self, periodo_inicio=None, periodo_fim=None, seletores_customizados=None, 
-                 use_cache=True, cache_hours=24):
+                 use_cache=True, cache_hours=24, max_concorrencia=10, requisicoes_por_segundo=5):
         """
         Inicializa o scraper do InovaWeek UVV com sistema de cache.
         
@@ -273,11 +612,18 @@ class UVVInovaWeekScraper:
             seletores_customizados (dict): Seletores CSS customizados
             use_cache (bool): Se deve usar sistema de cache (padrão: True)
             cache_hours (int): Horas de validade do cache (padrão: 24h)
+            max_concorrencia (int): Notícias buscadas em paralelo (padrão: 10)
+            requisicoes_por_segundo (float): Ritmo máximo de novas requisições (padrão: 5)
         """
         # Configurações de período
         self.periodo_inicio = periodo_inicio or datetime(2025, 8, 1)
         self.periodo_fim = periodo_fim or datetime(2025, 9, 30, 23, 59, 59)
         
+        # Concorrência e ritmo das requisições (rate limiting)
+        self.max_concorrencia = max_concorrencia
+        self.requisicoes_por_segundo = requisicoes_por_segundo
+        self.limitador = RateLimiter(requisicoes_por_segundo)
+        
         # 🗃️ Configuração do sistema de cache
         self.use_cache = use_cache
         if self.use_cache:
@@ -299,7 +645,9 @@ class UVVInovaWeekScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Só as codificações que o urllib3 consegue descomprimir aqui
+            # (inclui 'br' quando brotli/brotlicffi está instalado)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0'
@@ -310,23 +658,13 @@ class UVVInovaWeekScraper:
         self.session.headers.update(self.headers)
         
         # Configurações avançadas da session
-        # Reutilizar conexões TCP (pool de conexões)
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-        
-        # Estratégia de retry com backoff
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            backoff_factor=1,
-            raise_on_status=False
-        )
-        
-        # Adapter com pool de conexões
+        # Reutilizar conexões TCP (pool de conexões). O adapter é por instância:
+        # ele é dono do pool e é fechado junto com a session. Um único host
+        # (uvv.br), mas conexões suficientes para as buscas concorrentes
         adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
+            max_retries=self.RETRY_STRATEGY,
+            pool_connections=1,
+            pool_maxsize=max(20, self.max_concorrencia)
         )
         
         # Montar adapters para HTTP e HTTPS
@@ -339,9 +677,30 @@ class UVVInovaWeekScraper:
         # Seletores CSS para extração de dados
         self.seletores = self._configurar_seletores(seletores_customizados)
         
+        # Seletores compilados uma única vez pelo soupsieve: por categoria, a
+        # lista ordenada (seletor, matcher) e todos unidos em um só matcher
+        # (uma só passada na árvore para saber se alguma regra casa)
+        self._seletores_compilados = {}
+        self._seletor_joined = {}
+        for categoria, seletores in self.seletores.items():
+            if not seletores:
+                continue
+            self._seletores_compilados[categoria] = [
+                (seletor, self._compilar_seletor(seletor, categoria)) for seletor in seletores
+            ]
+            try:
+                self._seletor_joined[categoria] = sv.compile(', '.join(seletores))
+            except sv.SelectorSyntaxError:
+                # Algum seletor customizado inválido: sem atalho para a categoria
+                self._seletor_joined[categoria] = None
+        
         # Armazenamento das notícias coletadas
         self.noticias = []
         
+        # Formato de URL de paginação que funcionou (ex.: '.../page/{n}/'),
+        # aprendido na primeira página > 1 coletada com sucesso
+        self._modelo_url_pagina = None
+        
         # Timestamp do início do scraping
         self.timestamp_scraping = datetime.now()
         
@@ -352,6 +711,21 @@ class UVVInovaWeekScraper:
             'startup', 'hackathon', 'pitch', 'palestra inovação'
         ]
         
+        # Busca de todas as palavras-chave em uma só passada no texto. O
+        # lookahead captura, em cada posição, a palavra mais longa que começa
+        # ali; as que estão contidas nela (ex.: 'inova' em 'inovaweek') vêm
+        # do mapa _palavras_contidas, mantendo a contagem exata
+        self._palavras_chave_lower = [p.lower() for p in self.palavras_chave_inova]
+        chaves_lower = sorted(set(self._palavras_chave_lower), key=len, reverse=True)
+        self._palavras_chave_re = re.compile('(?=(' + '|'.join(map(re.escape, chaves_lower)) + '))')
+        self._palavras_contidas = {
+            chave: frozenset(
+                p for p, p_lower in zip(self.palavras_chave_inova, self._palavras_chave_lower)
+                if p_lower in chave
+            )
+            for chave in chaves_lower
+        }
+        
         print(f"🚀 UVV InovaWeek Scraper inicializado")
         print(f"📅 Período de coleta: {self.periodo_inicio.strftime('%d/%m/%Y')} até {self.periodo_fim.strftime('%d/%m/%Y')}")
         print(f"🕐 Scraping iniciado em: {self.timestamp_scraping.strftime('%d/%m/%Y %H:%M:%S')}")
@@ -451,6 +825,24 @@ class UVVInovaWeekScraper:
         
         return seletores_padrao
     
+    @staticmethod
+    def _compilar_seletor(seletor, categoria):
+        """
+        Compila um seletor CSS com o soupsieve.
+        
+        Args:
+            seletor (str): Seletor CSS
+            categoria (str): Categoria do seletor (para a mensagem de erro)
+            
+        Returns:
+            SoupSieve or None: Matcher compilado ou None se o seletor for inválido
+        """
+        try:
+            return sv.compile(seletor)
+        except sv.SelectorSyntaxError as e:
+            logger.warning("⚠️ Erro no seletor '%s' para %s: %s", seletor, categoria, e)
+            return None
+    
     def fazer_requisicao(self, url, params=None, timeout=30, max_tentativas=3):
         """
         Faz requisição HTTP com sistema de cache e tratamento robusto de erros.
@@ -469,7 +861,7 @@ class UVVInovaWeekScraper:
         if self.use_cache and self.cache:
             cached_response = self.cache.get(url, params)
             if cached_response:
-                print(f"🗃️ ✅ Cache HIT: {url}")
+                logger.debug("🗃️ ✅ Cache HIT: %s", url)
                 # Criar objeto response simulado do cache
                 response = requests.Response()
                 response.status_code = cached_response['data']['status_code']
@@ -477,31 +869,71 @@ class UVVInovaWeekScraper:
                 response.encoding = cached_response['data']['encoding']
                 response.url = cached_response['data']['url']
                 return response
+        
+        # 🗃️ Cache expirado ou ausente: usar validadores para GET condicional
+        validadores = None
+        headers_condicionais = {}
+        if self.use_cache and self.cache:
+            validadores = self.cache.get_validators(url, params)
+            if validadores:
+                if validadores.get('etag'):
+                    headers_condicionais['If-None-Match'] = validadores['etag']
+                if validadores.get('last_modified'):
+                    headers_condicionais['If-Modified-Since'] = validadores['last_modified']
+        
         for tentativa in range(max_tentativas):
             try:
                 # Log da URL com parâmetros (se houver)
                 if params:
-                    print(f"🔍 Fazendo requisição (tentativa {tentativa + 1}): {url} com params: {params}")
+                    logger.debug("🔍 Fazendo requisição (tentativa %d): %s com params: %s", tentativa + 1, url, params)
                 else:
-                    print(f"🔍 Fazendo requisição (tentativa {tentativa + 1}): {url}")
+                    logger.debug("🔍 Fazendo requisição (tentativa %d): %s", tentativa + 1, url)
+                
+                # Aguardar a vez no limitador de taxa (só requisições de rede)
+                self.limitador.acquire()
                 
                 # Requisição usando melhores práticas do requests
                 response = self.session.get(
                     url, 
                     params=params,  # Parâmetros URL codificados automaticamente
+                    headers=headers_condicionais,
                     timeout=timeout,
-                    allow_redirects=True  # Permitir redirecionamentos
+                    allow_redirects=True,  # Permitir redirecionamentos
+                    stream=False  # Corpo já descomprimido em response.content
                 )
                 
+                # 304 Not Modified: reaproveitar o corpo da entrada principal
+                # (expirada, mas ainda em disco)
+                if response.status_code == 304 and validadores:
+                    entrada = self.cache.get_stale(url, params)
+                    if entrada is None:
+                        # Entrada removida entre a leitura dos validadores e a
+                        # resposta: repetir sem requisição condicional
+                        validadores = None
+                        headers_condicionais = {}
+                        continue
+                    logger.debug("🗃️ ✅ Não modificado (304): %s", url)
+                    self.cache.stats["revalidated"] += 1
+                    dados = entrada['data']
+                    response = requests.Response()
+                    response.status_code = dados['status_code']
+                    response._content = dados['content']
+                    response.encoding = dados['encoding']
+                    response.url = dados['url']
+                    self.cache.set(url, dados, params)
+                    return response
+                
                 # Verificar status HTTP usando raise_for_status()
                 response.raise_for_status()
                 
-                # Configurar encoding corretamente se necessário
+                # Configurar encoding corretamente se necessário (repassado ao
+                # parser junto com response.content, dispensando detecção)
                 if response.encoding is None or response.encoding == 'ISO-8859-1':
                     response.encoding = 'utf-8'
                 
-                print(f"✅ Status: {response.status_code} | URL Final: {response.url}")
-                print(f"📊 Tamanho: {len(response.content)} bytes | Encoding: {response.encoding}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("✅ Status: %s | URL Final: %s", response.status_code, response.url)
+                    logger.debug("📊 Tamanho: %d bytes | Encoding: %s", len(response.content), response.encoding)
                 
                 # 🗃️ Salvar no cache
                 if self.use_cache and self.cache:
@@ -512,28 +944,33 @@ class UVVInovaWeekScraper:
                         'url': str(response.url)
                     }
                     if self.cache.set(url, cache_data, params):
-                        print(f"🗃️ ✅ Resposta salva no cache")
+                        logger.debug("🗃️ ✅ Resposta salva no cache")
+                    
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    if etag or last_modified:
+                        self.cache.set_validators(url, etag, last_modified, params)
                 
                 return response
                 
             except requests.exceptions.Timeout as e:
-                print(f"⏰ Timeout na tentativa {tentativa + 1} para {url}: {e}")
+                logger.warning("⏰ Timeout na tentativa %d para %s: %s", tentativa + 1, url, e)
                 if tentativa < max_tentativas - 1:
                     time.sleep(2 ** tentativa)  # Backoff exponencial
             except requests.exceptions.ConnectionError as e:
-                print(f"🔌 Erro de conexão na tentativa {tentativa + 1} para {url}: {e}")
+                logger.warning("🔌 Erro de conexão na tentativa %d para %s: %s", tentativa + 1, url, e)
                 if tentativa < max_tentativas - 1:
                     time.sleep(2 ** tentativa)
             except requests.exceptions.HTTPError as e:
-                print(f"🚫 Erro HTTP na tentativa {tentativa + 1} para {url}: {e}")
+                logger.warning("🚫 Erro HTTP na tentativa %d para %s: %s", tentativa + 1, url, e)
                 if tentativa < max_tentativas - 1:
                     time.sleep(2 ** tentativa)
             except requests.exceptions.RequestException as e:
-                print(f"❌ Erro geral na tentativa {tentativa + 1} para {url}: {e}")
+                logger.warning("❌ Erro geral na tentativa %d para %s: %s", tentativa + 1, url, e)
                 if tentativa < max_tentativas - 1:
                     time.sleep(2 ** tentativa)
         
-        print(f"❌ Falhou após {max_tentativas} tentativas")
+        logger.error("❌ Falhou após %d tentativas: %s", max_tentativas, url)
         return None
     
     def construir_url_busca(self, termo_busca=None, pagina=1, data_inicio=None, data_fim=None):
@@ -573,12 +1010,37 @@ class UVVInovaWeekScraper:
         params['category'] = 'noticias'
         params['type'] = 'news'
         
-        print(f"🔧 URL construída: {url_base}")
+        logger.debug("🔧 URL construída: %s", url_base)
         if params:
-            print(f"📋 Parâmetros URL: {params}")
+            logger.debug("📋 Parâmetros URL: %s", params)
             
         return url_base, params
     
+    def _sondar_pagina(self, numero_pagina):
+        """
+        Verifica com uma requisição HEAD se a página da listagem existe.
+        
+        Args:
+            numero_pagina (int): Número da página
+            
+        Returns:
+            str: 'ok', 'redirect' (volta para a página principal) ou 'erro'
+        """
+        url_teste = f"{self.base_url}/noticias/page/{numero_pagina}/"
+        try:
+            self.limitador.acquire()
+            response = self.session.head(url_teste, timeout=10, allow_redirects=False)
+        except requests.exceptions.RequestException as e:
+            logger.debug("❌ Erro ao sondar %s: %s", url_teste, e)
+            return 'erro'
+        
+        if response.status_code == 200:
+            return 'ok'
+        if response.is_redirect:
+            # Redirect dentro da paginação (ex.: barra final) ainda conta
+            return 'ok' if 'page' in response.headers.get('Location', '') else 'redirect'
+        return 'erro'
+    
     def testar_conectividade(self):
         """
         Testa conectividade com o site usando melhores práticas requests.
@@ -590,6 +1052,7 @@ class UVVInovaWeekScraper:
             print("🔧 Testando conectividade com o site...")
             
             # Fazer uma requisição HEAD primeiro (mais leve)
+            self.limitador.acquire()
             response = self.session.head(self.base_url, timeout=10, allow_redirects=True)
             
             if response.status_code in [200, 301, 302]:
@@ -617,7 +1080,8 @@ class UVVInovaWeekScraper:
             self.session.proxies.update(proxy_config)
             print(f"🔧 Proxy configurado: {proxy_config}")
     
-    def extrair_data_noticia(self, elemento_html, texto_elemento=None):
+    def extrair_data_noticia(self, elemento_html: Optional[Tag],
+                             texto_elemento: Optional[str] = None) -> Tuple[Optional[datetime], Optional[str]]:
         """
         Extrai e converte data da notícia com verificações robustas.
         
@@ -628,6 +1092,15 @@ class UVVInovaWeekScraper:
         Returns:
             tuple: (datetime object, string original) ou (None, None)
         """
+        # Caminho rápido: atributo HTML5 datetime em ISO 8601
+        # (<time datetime="2025-09-15T10:00:00-03:00">, o caso comum na UVV)
+        if elemento_html:
+            valor_datetime = elemento_html.get('datetime')
+            if valor_datetime:
+                data_obj = _parse_data_iso(valor_datetime)
+                if data_obj:
+                    return data_obj, valor_datetime
+        
         # Textos onde procurar data
         textos_para_buscar = []
         
@@ -645,71 +1118,14 @@ class UVVInovaWeekScraper:
         if texto_elemento:
             textos_para_buscar.append(texto_elemento)
         
-        # Padrões de data em português
-        padroes_data = [
-            (r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})', 'dd/mm/yyyy'),
-            (r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})', 'yyyy/mm/dd'),
-            (r'(\d{1,2}) de (\w+) de (\d{4})', 'dd de mês de yyyy'),
-            (r'(\d{1,2}) (\w+) (\d{4})', 'dd mês yyyy'),
-            (r'(\w+) (\d{1,2}), (\d{4})', 'mês dd, yyyy'),
-            (r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{2})', 'dd/mm/yy')
-        ]
-        
-        # Mapeamento de meses em português
-        meses_pt = {
-            'janeiro': 1, 'jan': 1,
-            'fevereiro': 2, 'fev': 2,
-            'março': 3, 'mar': 3,
-            'abril': 4, 'abr': 4,
-            'maio': 5, 'mai': 5,
-            'junho': 6, 'jun': 6,
-            'julho': 7, 'jul': 7,
-            'agosto': 8, 'ago': 8,
-            'setembro': 9, 'set': 9,
-            'outubro': 10, 'out': 10,
-            'novembro': 11, 'nov': 11,
-            'dezembro': 12, 'dez': 12
-        }
-        
         for texto in textos_para_buscar:
-            texto = texto.strip().lower()
-            
-            for padrao, formato in padroes_data:
-                match = re.search(padrao, texto)
-                if match:
-                    try:
-                        grupos = match.groups()
-                        
-                        if formato == 'dd/mm/yyyy':
-                            dia, mes, ano = map(int, grupos)
-                        elif formato == 'yyyy/mm/dd':
-                            ano, mes, dia = map(int, grupos)
-                        elif formato in ['dd de mês de yyyy', 'dd mês yyyy']:
-                            dia, nome_mes, ano = grupos
-                            dia, ano = int(dia), int(ano)
-                            mes = meses_pt.get(nome_mes.lower())
-                            if not mes:
-                                continue
-                        elif formato == 'mês dd, yyyy':
-                            nome_mes, dia, ano = grupos
-                            dia, ano = int(dia), int(ano)
-                            mes = meses_pt.get(nome_mes.lower())
-                            if not mes:
-                                continue
-                        elif formato == 'dd/mm/yy':
-                            dia, mes, ano = map(int, grupos)
-                            ano = 2000 + ano if ano < 50 else 1900 + ano
-                        
-                        # Validar data
-                        data_obj = datetime(ano, mes, dia)
-                        return data_obj, match.group(0)
-                        
-                    except (ValueError, TypeError):
-                        continue
+            data_obj, data_str = _parse_data_texto(texto)
+            if data_obj:
+                return data_obj, data_str
         
         return None, None
     
-    def eh_noticia_inovaweek(self, titulo, conteudo_texto="", periodo_valido=True):
+    def eh_noticia_inovaweek(self, titulo: str, conteudo_texto: str = "", periodo_valido: bool = True) -> bool:
         """
         Verifica se a notícia é relacionada ao InovaWeek.
         
@@ -725,11 +1141,22 @@ class UVVInovaWeekScraper:
         texto_completo = f"{titulo} {conteudo_texto}".lower()
         
         # Verificar palavras-chave do InovaWeek
-        for palavra in self.palavras_chave_inova:
-            if palavra.lower() in texto_completo:
-                return True
+        return self._palavras_chave_re.search(texto_completo) is not None
+    
+    def _palavras_chave_presentes(self, texto_lower: str) -> set:
+        """
+        Retorna as palavras-chave do InovaWeek presentes no texto.
         
-        return False
+        Args:
+            texto_lower (str): Texto já em minúsculas
+            
+        Returns:
+            set: Palavras de self.palavras_chave_inova encontradas no texto
+        """
+        encontradas = set()
+        for trecho in set(self._palavras_chave_re.findall(texto_lower)):
+            encontradas |= self._palavras_contidas[trecho]
+        return encontradas
     
     def eh_periodo_valido(self, data_noticia):
         """
@@ -746,7 +1173,8 @@ class UVVInovaWeekScraper:
         
         return self.periodo_inicio <= data_noticia <= self.periodo_fim
     
-    def extrair_com_seletores(self, soup, categoria_seletor, elemento_pai=None):
+    def extrair_com_seletores(self, soup: Tag, categoria_seletor: str,
+                              elemento_pai: Optional[Tag] = None) -> Optional[Tag]:
         """
         Extrai elemento usando múltiplos seletores CSS com verificações.
         
@@ -758,32 +1186,59 @@ class UVVInovaWeekScraper:
         Returns:
             BeautifulSoup element or None: Primeiro elemento encontrado
         """
+        elemento, _ = self._extrair_com_seletores_texto(soup, categoria_seletor, elemento_pai)
+        return elemento
+    
+    def _extrair_com_seletores_texto(self, soup: Tag, categoria_seletor: str,
+                                     elemento_pai: Optional[Tag] = None) -> Tuple[Optional[Tag], Optional[str]]:
+        """
+        Igual a extrair_com_seletores, mas devolve também o texto já extraído.
+        
+        O texto é calculado só para as categorias que o validam ('titulo' e
+        'autor'), evitando que o chamador percorra a subárvore de novo.
+        
+        Returns:
+            tuple: (elemento, texto sem espaços nas pontas ou None)
+        """
         base_soup = elemento_pai if elemento_pai else soup
-        seletores = self.seletores.get(categoria_seletor, [])
         
-        for seletor in seletores:
+        if categoria_seletor not in self._seletores_compilados:
+            return None, None
+        
+        # Atalho: uma única consulta com todos os seletores da categoria.
+        # Se nada casar, não há por que testar seletor por seletor.
+        seletor_unico = self._seletor_joined[categoria_seletor]
+        if seletor_unico is not None and seletor_unico.select_one(base_soup) is None:
+            return None, None
+        
+        # A lista ordenada é mantida para respeitar a prioridade dos seletores
+        # e as validações específicas de cada categoria
+        for seletor, matcher in self._seletores_compilados[categoria_seletor]:
+            if matcher is None:
+                continue
             try:
-                elementos = base_soup.select(seletor)
-                if elementos:
+                elemento = matcher.select_one(base_soup)
+                if elemento is not None:
                     # Verificar se o elemento tem conteúdo válido
-                    elemento = elementos[0]
-                    texto = elemento.get_text().strip()
+                    texto = None
                     
                     # Validações específicas por categoria
-                    if categoria_seletor == 'titulo' and len(texto) < 10:
-                        continue
-                    elif categoria_seletor == 'autor' and len(texto) < 2:
-                        continue
+                    if categoria_seletor in ('titulo', 'autor'):
+                        texto = elemento.get_text().strip()
+                        if categoria_seletor == 'titulo' and len(texto) < 10:
+                            continue
+                        elif categoria_seletor == 'autor' and len(texto) < 2:
+                            continue
                     elif categoria_seletor == 'link' and not elemento.get('href'):
                         continue
                     
-                    return elemento
+                    return elemento, texto
                         
             except Exception as e:
-                print(f"⚠️ Erro no seletor '{seletor}' para {categoria_seletor}: {e}")
+                logger.warning("⚠️ Erro no seletor '%s' para %s: %s", seletor, categoria_seletor, e)
                 continue
         
-        return None
+        return None, None
     
     def processar_noticia_individual(self, url_noticia):
         """
@@ -795,18 +1250,18 @@ class UVVInovaWeekScraper:
         Returns:
             dict: Dados completos da notícia
         """
-        # Rate limiting (ser respeitoso com o servidor)
-        time.sleep(1)
-        
         # Fazer requisição usando melhores práticas (sem parâmetros adicionais para página individual)
         response = self.fazer_requisicao(url_noticia, params=None)
         if not response:
             return {'conteudo_completo': '', 'erro': 'Falha na requisição'}
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Remover scripts/estilos antes de montar a árvore (direto nos bytes,
+        # sem decodificar o corpo inteiro em str via response.text)
+        html = _SCRIPT_STYLE_RE.sub(b'', response.content)
+        soup = BeautifulSoup(html, _PARSER_HTML, from_encoding=response.encoding)
         
-        # Remover elementos desnecessários
-        for elemento in soup.select('script, style, nav, header, footer, aside, .menu, .navigation'):
+        # Remover elementos estruturais desnecessários (precisam do contexto da árvore)
+        for elemento in _ESTRUTURA_SELETOR.select(soup):
             elemento.decompose()
         
         # Extrair conteúdo principal
@@ -846,19 +1301,22 @@ class UVVInovaWeekScraper:
             'tamanho_conteudo': len(conteudo_texto)
         }
     
-    def _eh_texto_navegacao(self, texto):
-        """Verifica se o texto parece ser de navegação/menu."""
-        texto_lower = texto.lower()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _eh_texto_navegacao(texto: str) -> bool:
+        """
+        Verifica se o texto parece ser de navegação/menu.
         
-        # Palavras típicas de navegação da UVV
-        palavras_navegacao = [
-            'institucional', 'graduação', 'pós graduação', 'mestrado',
-            'doutorado', 'pesquisa', 'extensão', 'contato', 'blog',
-            'notícias', 'eventos', 'portal', 'trabalhe conosco'
-        ]
+        Memoizado: os mesmos textos de menu/rodapé se repetem em todas as páginas.
+        """
+        texto_lower = texto.lower()
         
-        # Se contém principalmente palavras de navegação
-        palavras_nav_encontradas = sum(1 for palavra in palavras_navegacao if palavra in texto_lower)
+        # Se contém principalmente palavras de navegação (a regex descarta
+        # em uma só passada os textos sem nenhuma delas)
+        if _NAVEGACAO_RE.search(texto_lower):
+            palavras_nav_encontradas = sum(1 for palavra in _PALAVRAS_NAVEGACAO if palavra in texto_lower)
+        else:
+            palavras_nav_encontradas = 0
         palavras_totais = len(texto.split())
         
         if palavras_totais > 0 and (palavras_nav_encontradas / palavras_totais) > 0.5:
@@ -870,30 +1328,34 @@ class UVVInovaWeekScraper:
             
         return False
     
-    def extrair_noticias_pagina(self, html_content, url_pagina):
+    def extrair_noticias_pagina(self, html_content, url_pagina, encoding=None):
         """
         Extrai notícias de uma página específica.
         
         Args:
-            html_content (str): HTML da página
+            html_content (bytes or str): HTML da página
             url_pagina (str): URL da página atual
+            encoding (str): Encoding de html_content quando em bytes
             
         Returns:
             list: Lista de notícias extraídas
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _PARSER_HTML, from_encoding=encoding)
         noticias_encontradas = []
         
-        print(f"📄 Analisando página: {url_pagina}")
+        logger.debug("📄 Analisando página: %s", url_pagina)
         
         # Buscar containers de notícias com múltiplas estratégias
         containers = set()  # Use set para evitar duplicatas
         
-        # Estratégia 1: Usar seletores configurados
-        for seletor in self.seletores['container_noticias']:
-            elementos = soup.select(seletor)
-            for elem in elementos:
-                containers.add(elem)
+        # Estratégia 1: Usar seletores configurados (todos em uma única consulta)
+        seletor_containers = self._seletor_joined.get('container_noticias')
+        if seletor_containers is not None:
+            containers.update(seletor_containers.select(soup))
+        else:
+            for _, matcher in self._seletores_compilados.get('container_noticias', []):
+                if matcher is not None:
+                    containers.update(matcher.select(soup))
         
         # Estratégia 2: Buscar elementos que contenham links para notícias
         links_noticias = soup.find_all('a', href=True)
@@ -906,23 +1368,22 @@ class UVVInovaWeekScraper:
                     containers.add(container_pai)
         
         # Estratégia 3: Buscar por elementos com texto que contenha palavras-chave
-        for palavra_chave in ['inovaweek', 'inova', 'setembro', 'agosto']:
-            elementos_texto = soup.find_all(string=re.compile(palavra_chave, re.IGNORECASE))
-            for texto in elementos_texto:
-                if hasattr(texto, 'parent'):
-                    container_texto = texto.parent.find_parent(['div', 'article', 'section'])
-                    if container_texto:
-                        containers.add(container_texto)
+        # (uma única regex com todas as palavras: uma passada na árvore)
+        for texto in soup.find_all(string=_PALAVRAS_CONTAINER_RE):
+            if hasattr(texto, 'parent'):
+                container_texto = texto.parent.find_parent(['div', 'article', 'section'])
+                if container_texto:
+                    containers.add(container_texto)
         
         containers = list(containers)  # Converter de volta para lista
-        print(f"🔍 Encontrados {len(containers)} containers únicos de notícias")
+        logger.info("🔍 Encontrados %d containers únicos de notícias", len(containers))
         
         for i, container in enumerate(containers):
             try:
                 noticia_data = self._extrair_dados_noticia(container, url_pagina)
                 
                 if noticia_data and noticia_data.get('titulo'):
-                    print(f"📋 {i+1}/{len(containers)} Analisando: {noticia_data['titulo'][:60]}...")
+                    logger.debug("📋 %d/%d Analisando: %s...", i + 1, len(containers), noticia_data['titulo'][:60])
                     
                     # Verificar se é notícia do InovaWeek (mais flexível)
                     eh_inovaweek = self.eh_noticia_inovaweek(
@@ -933,14 +1394,14 @@ class UVVInovaWeekScraper:
                     
                     if eh_inovaweek:
                         noticias_encontradas.append(noticia_data)
-                        print(f"✅ Notícia InovaWeek encontrada: {noticia_data['titulo'][:60]}...")
+                        logger.info("✅ Notícia InovaWeek encontrada: %s...", noticia_data['titulo'][:60])
                     else:
-                        print(f"❌ Não é InovaWeek: {noticia_data['titulo'][:60]}...")
+                        logger.debug("❌ Não é InovaWeek: %s...", noticia_data['titulo'][:60])
                 else:
-                    print(f"⚠️ {i+1}/{len(containers)} Container sem título válido")
+                    logger.debug("⚠️ %d/%d Container sem título válido", i + 1, len(containers))
                     
             except Exception as e:
-                print(f"⚠️ Erro ao processar container {i+1}: {e}")
+                logger.warning("⚠️ Erro ao processar container %d: %s", i + 1, e)
                 continue
         
         return noticias_encontradas
@@ -964,19 +1425,20 @@ class UVVInovaWeekScraper:
             'data_publicacao_str': '',
             'resumo': '',
             'conteudo_completo': '',
-            'timestamp_coleta': self.timestamp_scraping.isoformat(),
+            'timestamp_coleta': self.timestamp_scraping,
             'url_fonte': url_pagina,
             'periodo_valido': False
         }
         
         # Extrair título com múltiplas estratégias
-        elem_titulo = self.extrair_com_seletores(container, 'titulo', container)
+        elem_titulo, texto_titulo = self._extrair_com_seletores_texto(container, 'titulo', container)
         if elem_titulo:
-            noticia['titulo'] = elem_titulo.get_text().strip()
+            noticia['titulo'] = texto_titulo
         else:
             # Estratégia alternativa: buscar qualquer texto significativo
-            textos = container.find_all(string=True)
-            for texto in textos:
+            # (container.strings é um gerador: para no primeiro texto válido
+            # sem materializar todos os nós de texto do container)
+            for texto in container.strings:
                 texto_limpo = texto.strip()
                 if len(texto_limpo) > 20 and not self._eh_texto_navegacao(texto_limpo):
                     noticia['titulo'] = texto_limpo
@@ -997,9 +1459,9 @@ class UVVInovaWeekScraper:
             noticia['link'] = link
         
         # Extrair autor
-        elem_autor = self.extrair_com_seletores(container, 'autor', container)
+        elem_autor, texto_autor = self._extrair_com_seletores_texto(container, 'autor', container)
         if elem_autor:
-            noticia['autor'] = elem_autor.get_text().strip()
+            noticia['autor'] = texto_autor
         
         # Extrair data de publicação
         elem_data = self.extrair_com_seletores(container, 'data_publicacao', container)
@@ -1010,24 +1472,32 @@ class UVVInovaWeekScraper:
             noticia['data_publicacao_str'] = data_str
             noticia['periodo_valido'] = self.eh_periodo_valido(data_obj)
         
-        # Extrair resumo (se disponível)
-        paragrafos = container.find_all('p')
-        if paragrafos:
-            for p in paragrafos:
-                texto_p = p.get_text().strip()
-                if len(texto_p) > 50 and not self._eh_texto_navegacao(texto_p):
-                    noticia['resumo'] = texto_p[:300]
-                    break
+        # Extrair resumo (se disponível): find() encerra a busca no
+        # primeiro parágrafo válido em vez de listar todos os <p>
+        paragrafo = container.find(self._eh_paragrafo_resumo)
+        if paragrafo:
+            noticia['resumo'] = paragrafo.get_text().strip()[:300]
         
         return noticia
     
-    def coletar_noticias_inovaweek(self, max_paginas=10, somente_primeira_pagina=False):
+    def _eh_paragrafo_resumo(self, tag):
+        """Verifica se a tag é um parágrafo com texto suficiente para resumo."""
+        if tag.name != 'p':
+            return False
+        
+        texto_p = tag.get_text().strip()
+        return len(texto_p) > 50 and not self._eh_texto_navegacao(texto_p)
+    
+    def coletar_noticias_inovaweek(self, max_paginas=10, somente_primeira_pagina=False,
+                                   checkpoint_path=None):
         """
         Método principal para coletar notícias do InovaWeek com suporte a paginação.
         
         Args:
             max_paginas (int): Número máximo de páginas para vasculhar (padrão: 10)
             somente_primeira_pagina (bool): Se deve coletar apenas a primeira página
+            checkpoint_path (str): Arquivo JSONL de checkpoint (opcional). Notícias
+                já processadas nele não são buscadas de novo ao retomar a coleta
         
         Returns:
             list: Lista de notícias do InovaWeek coletadas de todas as páginas
@@ -1045,6 +1515,7 @@ class UVVInovaWeekScraper:
         
         # Coletar notícias de múltiplas páginas
         todas_noticias = []
+        links_vistos = set()  # Notícias repetidas entre páginas (widgets de "recentes")
         paginas_processadas = 0
         paginas_sem_noticias = 0
         
@@ -1070,12 +1541,21 @@ class UVVInovaWeekScraper:
                 paginas_sem_noticias = 0  # Reset contador
                 
             print(f"✅ Página {numero_pagina}: {len(noticias_pagina)} notícias InovaWeek encontradas")
-            todas_noticias.extend(noticias_pagina)
-            paginas_processadas += 1
             
-            # Rate limiting entre páginas
-            if numero_pagina < max_paginas:
-                time.sleep(2)  # Pausa respeitosa entre páginas
+            # Descartar links já coletados (notícias sem link são mantidas)
+            novas = []
+            for noticia in noticias_pagina:
+                link = noticia.get('link')
+                if link and link != '#':
+                    if link in links_vistos:
+                        continue
+                    links_vistos.add(link)
+                novas.append(noticia)
+            if len(novas) < len(noticias_pagina):
+                print(f"♻️ {len(noticias_pagina) - len(novas)} notícias repetidas descartadas")
+            
+            todas_noticias.extend(novas)
+            paginas_processadas += 1
         
         print(f"\n🎉 === COLETA PAGINADA FINALIZADA ===")
         print(f"📄 Páginas processadas: {paginas_processadas}")
@@ -1083,15 +1563,8 @@ class UVVInovaWeekScraper:
         
         # Processar cada notícia para extrair conteúdo completo
         print(f"\n📖 === EXTRAINDO CONTEÚDO COMPLETO ===")
-        for i, noticia in enumerate(todas_noticias):
-            if noticia.get('link') and noticia['link'] != '#':
-                print(f"📖 Processando {i+1}/{len(todas_noticias)}: {noticia['titulo'][:50]}...")
-                
-                conteudo_dados = self.processar_noticia_individual(noticia['link'])
-                noticia.update(conteudo_dados)
-                
-                # Rate limiting para ser respeitoso
-                time.sleep(1)
+        # Páginas individuais buscadas em paralelo (I/O de rede domina o tempo)
+        self._processar_noticias_concorrente(todas_noticias, checkpoint_path)
         
         self.noticias = todas_noticias
         
@@ -1102,6 +1575,109 @@ class UVVInovaWeekScraper:
         
         return self.noticias
     
+    def _processar_noticias_concorrente(self, noticias, checkpoint_path=None):
+        """
+        Extrai o conteúdo completo das notícias com requisições concorrentes.
+        
+        Cada URL distinta é processada uma única vez (notícias repetidas entre
+        páginas reaproveitam o resultado). As buscas rodam num pool de
+        self.max_concorrencia threads (requests libera o GIL durante o I/O);
+        o ritmo das requisições fica a cargo do limitador de taxa usado em
+        fazer_requisicao.
+        
+        Args:
+            noticias (list): Notícias da listagem (atualizadas in-place)
+            checkpoint_path (str): Arquivo JSONL de checkpoint (opcional)
+        """
+        # URLs distintas, na ordem em que aparecem
+        links = list(dict.fromkeys(
+            n['link'] for n in noticias if n.get('link') and n['link'] != '#'
+        ))
+        if not links:
+            return
+        
+        # Retomar: URLs já concluídas em execuções anteriores
+        conteudo_por_url = self._carregar_checkpoint(checkpoint_path) if checkpoint_path else {}
+        pendentes = [link for link in links if link not in conteudo_por_url]
+        if len(pendentes) < len(links):
+            print(f"♻️ Checkpoint: {len(links) - len(pendentes)} notícias já processadas")
+        
+        arquivo_checkpoint = open(checkpoint_path, 'ab') if checkpoint_path else None
+        trava_checkpoint = threading.Lock()
+        
+        def processar(indice, link):
+            logger.info("📖 Processando %d/%d: %s", indice, len(pendentes), link)
+            dados = self.processar_noticia_individual(link)
+            
+            # Só resultados com sucesso entram no checkpoint (falhas são refeitas)
+            if arquivo_checkpoint and 'erro' not in dados:
+                registro = {'url': link, 'dados': dados}
+                if orjson is not None:
+                    linha = orjson.dumps(registro)
+                else:
+                    linha = json.dumps(registro, ensure_ascii=False).encode('utf-8')
+                with trava_checkpoint:
+                    arquivo_checkpoint.write(linha + b'\n')
+                    arquivo_checkpoint.flush()
+            return dados
+        
+        # requests é bloqueante: cada busca roda numa thread do pool,
+        # todas compartilhando a mesma session (e seu pool de conexões)
+        resultados = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concorrencia,
+                                    thread_name_prefix='inovaweek') as executor:
+                futuros = {
+                    executor.submit(processar, i, link): link
+                    for i, link in enumerate(pendentes, 1)
+                }
+                for futuro in as_completed(futuros):
+                    link = futuros[futuro]
+                    try:
+                        resultados[link] = futuro.result()
+                    except Exception as e:
+                        logger.warning("⚠️ Erro ao processar %s: %s", link, e)
+                        resultados[link] = {'conteudo_completo': '', 'erro': str(e)}
+        finally:
+            if arquivo_checkpoint:
+                arquivo_checkpoint.close()
+        
+        conteudo_por_url.update(resultados)
+        
+        for noticia in noticias:
+            if noticia.get('link') in conteudo_por_url:
+                noticia.update(conteudo_por_url[noticia['link']])
+    
+    @staticmethod
+    def _carregar_checkpoint(checkpoint_path):
+        """
+        Lê o checkpoint JSONL de notícias já processadas.
+        
+        Args:
+            checkpoint_path (str): Caminho do arquivo de checkpoint
+            
+        Returns:
+            dict: URL -> dados extraídos por processar_noticia_individual
+        """
+        conteudo_por_url = {}
+        if not os.path.exists(checkpoint_path):
+            return conteudo_por_url
+        
+        carregar_json = orjson.loads if orjson is not None else json.loads
+        
+        # Leitura em bytes (UTF-8): os dois decodificadores aceitam bytes, e o
+        # JSONDecodeError do orjson é subclasse do da biblioteca padrão
+        with open(checkpoint_path, 'rb') as f:
+            for linha in f:
+                try:
+                    registro = carregar_json(linha)
+                except json.JSONDecodeError:
+                    # Última linha truncada por uma interrupção: ignorar
+                    continue
+                conteudo_por_url[registro['url']] = registro['dados']
+        
+        return conteudo_por_url
+    
     def _coletar_noticias_pagina_especifica(self, numero_pagina):
         """
         Coleta notícias de uma página específica.
@@ -1112,42 +1688,58 @@ class UVVInovaWeekScraper:
         Returns:
             list: Lista de notícias InovaWeek da página
         """
-        # Construir URLs para diferentes formatos de paginação
-        urls_tentar = [
+        # Formatos de paginação ({n} = número da página)
+        modelos_tentar = [
             # Formato padrão com /page/X/
-            f"{self.base_url}/noticias/page/{numero_pagina}/",
+            f"{self.base_url}/noticias/page/{{n}}/",
             # Formato alternativo
-            f"{self.noticias_url}page/{numero_pagina}/",
+            f"{self.noticias_url}page/{{n}}/",
             # Formato com parâmetro
-            f"{self.noticias_url}?page={numero_pagina}",
-            f"{self.noticias_url}?p={numero_pagina}"
+            f"{self.noticias_url}?page={{n}}",
+            f"{self.noticias_url}?p={{n}}"
         ]
+        # base_url/noticias/ e noticias_url coincidem: não repetir a requisição
+        modelos_tentar = list(dict.fromkeys(modelos_tentar))
         
-        # Se for página 1, tentar também a URL base
         if numero_pagina == 1:
-            urls_tentar.insert(0, self.noticias_url)
-        
-        for url_tentativa in urls_tentar:
-            print(f"🔍 Tentando URL: {url_tentativa}")
+            # Se for página 1, tentar também a URL base
+            modelos_tentar.insert(0, self.noticias_url)
+        elif self._modelo_url_pagina:
+            # Formato já conhecido: é o único tentado, a menos que falhe
+            modelos_tentar.remove(self._modelo_url_pagina)
+            modelos_tentar.insert(0, self._modelo_url_pagina)
+        
+        for modelo in modelos_tentar:
+            url_tentativa = modelo.format(n=numero_pagina)
+            modelo_conhecido = numero_pagina > 1 and modelo == self._modelo_url_pagina
+            logger.debug("🔍 Tentando URL: %s", url_tentativa)
             
             response = self.fazer_requisicao(url_tentativa)
             
             if response and response.status_code == 200:
                 # Verificar se a página realmente existe (não é redirect para página 1)
                 if numero_pagina > 1 and 'page' not in response.url and numero_pagina != 1:
-                    print(f"⚠️ Possível redirect para página principal - pulando")
+                    logger.debug("⚠️ Possível redirect para página principal - pulando")
                     continue
                 
                 # Extrair notícias da página
-                noticias_pagina = self.extrair_noticias_pagina(response.text, url_tentativa)
+                noticias_pagina = self.extrair_noticias_pagina(
+                    response.content, url_tentativa, encoding=response.encoding
+                )
                 
                 if noticias_pagina:
-                    print(f"✅ Página {numero_pagina} acessada com sucesso: {len(noticias_pagina)} notícias InovaWeek")
+                    logger.info("✅ Página %d acessada com sucesso: %d notícias InovaWeek", numero_pagina, len(noticias_pagina))
+                    if numero_pagina > 1:
+                        self._modelo_url_pagina = modelo
                     return noticias_pagina
                 else:
-                    print(f"📭 Página {numero_pagina} acessada mas sem notícias InovaWeek")
+                    logger.info("📭 Página %d acessada mas sem notícias InovaWeek", numero_pagina)
+                    if modelo_conhecido:
+                        # A página existe no formato conhecido: os demais
+                        # formatos devolveriam a mesma listagem
+                        return []
             else:
-                print(f"❌ Falha ao acessar: {url_tentativa}")
+                logger.debug("❌ Falha ao acessar: %s", url_tentativa)
         
         return []
     
@@ -1165,34 +1757,27 @@ class UVVInovaWeekScraper:
         if not response:
             return 1
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Procurar por indicadores de paginação
-        links_paginacao = []
-        
-        # Seletores comuns para paginação
-        seletores_paginacao = [
-            'a[href*="page"]',
-            '.pagination a',
-            '.pager a',
-            'nav a[href*="page"]',
-            '.page-numbers a',
-            '.wp-pagenavi a'
-        ]
-        
-        for seletor in seletores_paginacao:
-            links = soup.select(seletor)
-            for link in links:
-                href = link.get('href', '')
-                if 'page' in href:
-                    links_paginacao.append(href)
+        # Procurar por indicadores de paginação: links com 'page' no href
+        # (.pagination, .pager, .wp-pagenavi etc. também exigiam isso).
+        # Sem CSS no caminho do BeautifulSoup: o strainer já filtra os links
+        if LexborHTMLParser is not None:
+            # O lexbor lê bytes como UTF-8: com página UTF-8 o corpo vai
+            # direto, sem a decodificação de response.text
+            if codecs.lookup(response.encoding or 'utf-8').name == 'utf-8':
+                arvore = LexborHTMLParser(response.content)
+            else:
+                arvore = LexborHTMLParser(response.text)
+            links_paginacao = [no.attributes.get('href') or '' for no in arvore.css('a[href*="page"]')]
+        else:
+            soup = BeautifulSoup(response.content, _PARSER_HTML, from_encoding=response.encoding,
+                                 parse_only=_PAGINACAO_STRAINER)
+            links_paginacao = [link['href'] for link in soup.find_all('a')]
         
         # Extrair números de página dos links
         numeros_pagina = []
         for link in links_paginacao:
             # Tentar extrair número da página
-            import re
-            match = re.search(r'page[/=](\d+)', link)
+            match = _NUMERO_PAGINA_RE.search(link)
             if match:
                 numeros_pagina.append(int(match.group(1)))
         
@@ -1202,24 +1787,22 @@ class UVVInovaWeekScraper:
         print(f"📄 Máxima página encontrada: {max_pagina}")
         
         # Verificar se realmente existem mais páginas testando algumas
+        # (HEADs em paralelo: só o status importa, não o corpo)
+        paginas_teste = range(2, min(max_pagina + 1, 6))  # Testar até página 5
+        with ThreadPoolExecutor(max_workers=max(1, len(paginas_teste))) as executor:
+            resultados = list(executor.map(self._sondar_pagina, paginas_teste))
+        
         paginas_existentes = 1
-        for teste_pagina in range(2, min(max_pagina + 1, 6)):  # Testar até página 5
-            url_teste = f"{self.base_url}/noticias/page/{teste_pagina}/"
-            response_teste = self.fazer_requisicao(url_teste)
-            
-            if response_teste and response_teste.status_code == 200:
-                # Verificar se não é redirect para página principal
-                if 'page' in response_teste.url or teste_pagina == 1:
-                    paginas_existentes = teste_pagina
-                    print(f"✅ Página {teste_pagina} confirmada")
-                else:
-                    print(f"❌ Página {teste_pagina} redireciona para principal")
-                    break
+        for teste_pagina, situacao in zip(paginas_teste, resultados):
+            if situacao == 'ok':
+                paginas_existentes = teste_pagina
+                print(f"✅ Página {teste_pagina} confirmada")
+            elif situacao == 'redirect':
+                print(f"❌ Página {teste_pagina} redireciona para principal")
+                break
             else:
                 print(f"❌ Página {teste_pagina} não acessível")
                 break
-                
-            time.sleep(1)  # Rate limiting
         
         print(f"📊 Total de páginas confirmadas: {paginas_existentes}")
         return max(paginas_existentes, max_pagina if numeros_pagina else 1)
@@ -1283,13 +1866,25 @@ class UVVInovaWeekScraper:
             ]
             
             with open(filename, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames_estruturados)
-                writer.writeheader()
+                # csv.writer com linhas posicionais: evita a conversão
+                # dict -> lista por campo que o DictWriter faz a cada linha
+                writer = csv.writer(file)
+                writer.writerow(fieldnames_estruturados)
+                
+                # Contagens das estatísticas acumuladas durante a escrita,
+                # sem uma segunda passada pelas notícias
+                qualidades = Counter()
+                relevancias = Counter()
                 
                 for i, noticia in enumerate(self.noticias, 1):
-                    # Preparar dados estruturados para CSV
+                    # Preparar dados estruturados para CSV (o dict é montado
+                    # na mesma ordem de fieldnames_estruturados)
                     row = self._preparar_dados_estruturados(noticia, i)
-                    writer.writerow(row)
+                    writer.writerow(tuple(row.values()))
+                    
+                    # A estatística de qualidade usa o conteúdo bruto
+                    qualidades[self._avaliar_qualidade_conteudo(noticia.get('conteudo_completo', ''))] += 1
+                    relevancias[row['relevancia_inovaweek']] += 1
             
             print(f"💾 CSV estruturado exportado: {filename}")
             
@@ -1298,7 +1893,7 @@ class UVVInovaWeekScraper:
                 self._gerar_arquivo_metadados(filename)
             
             # Estatísticas detalhadas
-            self._exibir_estatisticas_export(filename)
+            self._exibir_estatisticas_export(filename, qualidades, relevancias)
             
             return filename
             
@@ -1329,21 +1924,23 @@ class UVVInovaWeekScraper:
         palavras = conteudo_limpo.split() if conteudo_limpo else []
         
         # Detectar palavras-chave do InovaWeek
-        palavras_chave_encontradas = []
-        conteudo_lower = conteudo_limpo.lower()
-        for palavra in self.palavras_chave_inova:
-            if palavra.lower() in conteudo_lower:
-                palavras_chave_encontradas.append(palavra)
+        presentes = self._palavras_chave_presentes(conteudo_limpo.lower())
+        palavras_chave_encontradas = [p for p in self.palavras_chave_inova if p in presentes]
         
         # Determinar qualidade do conteúdo
         qualidade = self._avaliar_qualidade_conteudo(conteudo_limpo)
+        relevancia = self._calcular_relevancia_inovaweek(noticia)
         
         # Processar datas
         data_pub = noticia.get('data_publicacao')
-        data_iso = data_pub.isoformat() if isinstance(data_pub, datetime) else ''
-        data_formatada = data_pub.strftime('%d/%m/%Y %H:%M') if isinstance(data_pub, datetime) else ''
-        mes_pub = data_pub.strftime('%Y-%m') if isinstance(data_pub, datetime) else ''
-        ano_pub = data_pub.year if isinstance(data_pub, datetime) else ''
+        if isinstance(data_pub, datetime):
+            data_iso = data_pub.isoformat()
+            data_formatada = data_pub.strftime('%d/%m/%Y %H:%M')
+            # Mês e ano direto dos campos, sem nova formatação
+            mes_pub = f"{data_pub.year:04d}-{data_pub.month:02d}"
+            ano_pub = data_pub.year
+        else:
+            data_iso = data_formatada = mes_pub = ano_pub = ''
         
         # Timestamp de coleta
         timestamp_coleta = self.timestamp_scraping
@@ -1376,7 +1973,7 @@ class UVVInovaWeekScraper:
             
             # === CLASSIFICAÇÃO ===
             'categoria_evento': self._classificar_categoria_evento(noticia.get('titulo', '')),
-            'relevancia_inovaweek': self._calcular_relevancia_inovaweek(noticia),
+            'relevancia_inovaweek': relevancia,
             'periodo_valido': noticia.get('periodo_valido', True),
             'status_processamento': 'COMPLETO' if conteudo_limpo else 'PARCIAL',
             
@@ -1393,13 +1990,11 @@ class UVVInovaWeekScraper:
             return ''
         
         # Remover quebras de linha duplas e múltiplas
-        conteudo = re.sub(r'\n\s*\n', '\n', conteudo)
+        conteudo = _LINHAS_VAZIAS_RE.sub('\n', conteudo)
         # Remover espaços extras
-        conteudo = re.sub(r'\s+', ' ', conteudo)
+        conteudo = _ESPACOS_RE.sub(' ', conteudo)
         # Remover caracteres de controle
-        conteudo = ''.join(char for char in conteudo if ord(char) >= 32 or char in '\n\t')
-        
-        return conteudo.strip()
+        return conteudo.translate(_TABELA_CONTROLE).strip()
     
     def _gerar_resumo_automatico(self, conteudo, max_palavras=50):
         """Gera resumo automático do conteúdo."""
@@ -1450,17 +2045,9 @@ class UVVInovaWeekScraper:
         titulo = noticia.get('titulo', '').lower()
         conteudo = noticia.get('conteudo_completo', '').lower()
         
-        pontos = 0
-        
-        # Pontuação por palavra-chave no título
-        for palavra in self.palavras_chave_inova:
-            if palavra.lower() in titulo:
-                pontos += 3
-        
-        # Pontuação por palavra-chave no conteúdo
-        for palavra in self.palavras_chave_inova:
-            if palavra.lower() in conteudo:
-                pontos += 1
+        # Pontuação por palavra-chave: 3 no título, 1 no conteúdo
+        pontos = 3 * len(self._palavras_chave_presentes(titulo))
+        pontos += len(self._palavras_chave_presentes(conteudo))
         
         # Classificar relevância
         if pontos >= 10:
@@ -1507,15 +2094,37 @@ class UVVInovaWeekScraper:
         except Exception as e:
             print(f"⚠️ Erro ao gerar metadados: {e}")
     
-    def _exibir_estatisticas_export(self, filename):
-        """Exibe estatísticas detalhadas do export."""
+    def _exibir_estatisticas_export(self, filename, qualidades=None, relevancias=None):
+        """
+        Exibe estatísticas detalhadas do export.
+        
+        Args:
+            filename (str): Arquivo exportado
+            qualidades (Counter): Notícias por qualidade, já contadas no export
+                (opcional; calculadas aqui quando ausentes)
+            relevancias (Counter): Notícias por relevância, já contadas no
+                export (opcional; calculadas aqui quando ausentes)
+        """
         print(f"\n📊 === ESTATÍSTICAS DETALHADAS DO EXPORT ===")
         
-        # Estatísticas básicas
+        calcular_qualidades = qualidades is None
+        calcular_relevancias = relevancias is None
+        if calcular_qualidades:
+            qualidades = Counter()
+        if calcular_relevancias:
+            relevancias = Counter()
+        
+        # Todas as contagens em uma única passada pelas notícias
         total = len(self.noticias)
-        com_conteudo = sum(1 for n in self.noticias if len(n.get('conteudo_completo', '')) > 100)
-        com_autor = sum(1 for n in self.noticias if n.get('autor'))
-        com_data = sum(1 for n in self.noticias if n.get('data_publicacao'))
+        com_conteudo = com_autor = com_data = 0
+        for noticia in self.noticias:
+            com_conteudo += len(noticia.get('conteudo_completo', '')) > 100
+            com_autor += bool(noticia.get('autor'))
+            com_data += bool(noticia.get('data_publicacao'))
+            if calcular_qualidades:
+                qualidades[self._avaliar_qualidade_conteudo(noticia.get('conteudo_completo', ''))] += 1
+            if calcular_relevancias:
+                relevancias[self._calcular_relevancia_inovaweek(noticia)] += 1
         
         print(f"📈 Geral:")
         print(f"   📰 Total de registros: {total}")
@@ -1524,22 +2133,11 @@ class UVVInovaWeekScraper:
         print(f"   📅 Com data de publicação: {com_data} ({com_data/total*100:.1f}%)")
         
         # Qualidade do conteúdo
-        qualidades = {}
-        for noticia in self.noticias:
-            conteudo = noticia.get('conteudo_completo', '')
-            qualidade = self._avaliar_qualidade_conteudo(conteudo)
-            qualidades[qualidade] = qualidades.get(qualidade, 0) + 1
-        
         print(f"\n📊 Qualidade do conteúdo:")
         for qualidade, count in sorted(qualidades.items()):
             print(f"   {qualidade}: {count} notícias")
         
         # Relevância InovaWeek
-        relevancias = {}
-        for noticia in self.noticias:
-            relevancia = self._calcular_relevancia_inovaweek(noticia)
-            relevancias[relevancia] = relevancias.get(relevancia, 0) + 1
-        
         print(f"\n🎯 Relevância InovaWeek:")
         for relevancia, count in sorted(relevancias.items(), reverse=True):
             print(f"   {relevancia}: {count} notícias")
@@ -1640,6 +2238,7 @@ class UVVInovaWeekScraper:
         print(f"🎯 Cache hits: {stats['hits']}")
         print(f"❌ Cache misses: {stats['misses']}")
         print(f"💾 Items salvos: {stats['saves']}")
+        print(f"🔁 Revalidados (304): {stats['revalidated']}")
         print(f"📊 Taxa de acerto: {stats['hit_rate_percent']}%")
         print(f"💿 Tamanho do cache: {stats['cache_size_mb']} MB")
         
@@ -1656,6 +2255,50 @@ class UVVInovaWeekScraper:
         """
         return self.fazer_requisicao(url)
 
+    def close(self):
+        """
+        Fecha a session e libera as conexões mantidas no pool (keep-alive).
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def configurar_logging(nivel=logging.INFO):
+    """
+    Configura o logging do scraper com emissão em thread separada.
+    
+    Os registros vão para uma fila (QueueHandler) e são escritos no stdout
+    por um QueueListener em segundo plano, tirando a escrita do caminho das
+    requisições.
+    
+    Args:
+        nivel (int): Nível mínimo de log (padrão: logging.INFO)
+        
+    Returns:
+        QueueListener: Listener iniciado (chamar .stop() ao final para esvaziar a fila)
+    """
+    fila = queue.Queue(-1)
+    
+    handler_console = logging.StreamHandler(sys.stdout)
+    handler_console.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(fila)]
+    root.setLevel(nivel)
+    
+    # O DEBUG do urllib3 repete cada conexão; manter só avisos
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    
+    listener = QueueListener(fila, handler_console)
+    listener.start()
+    return listener
+
 
 def main():
     """Função principal com argumentos de linha de comando."""
@@ -1713,8 +2356,22 @@ Exemplos de uso:
         help='Verificar quantas páginas estão disponíveis antes de coletar'
     )
     
+    parser.add_argument(
+        '--checkpoint',
+        type=str,
+        help='Arquivo JSONL de checkpoint para retomar uma coleta interrompida'
+    )
+    
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Exibir logs detalhados de cada requisição e container'
+    )
+    
     args = parser.parse_args()
     
+    listener_log = configurar_logging(logging.DEBUG if args.verbose else logging.INFO)
+    
     # Processar datas
     periodo_inicio = None
     periodo_fim = None
@@ -1748,46 +2405,48 @@ Exemplos de uso:
     print("=" * 60)
     
     try:
-        scraper = UVVInovaWeekScraper(
+        with UVVInovaWeekScraper(
             periodo_inicio=periodo_inicio,
             periodo_fim=periodo_fim,
             seletores_customizados=seletores_customizados
-        )
-        
-        # Verificar paginação se solicitado
-        if args.verificar_paginacao:
-            paginas_disponiveis = scraper.verificar_paginacao_disponivel()
-            print(f"\n📊 Paginação disponível: {paginas_disponiveis} páginas")
+        ) as scraper:
+            # Verificar paginação se solicitado
+            if args.verificar_paginacao:
+                paginas_disponiveis = scraper.verificar_paginacao_disponivel()
+                print(f"\n📊 Paginação disponível: {paginas_disponiveis} páginas")
             
-            # Ajustar max_paginas se necessário
-            if args.max_paginas > paginas_disponiveis:
-                print(f"⚠️ Ajustando max-paginas de {args.max_paginas} para {paginas_disponiveis}")
-                args.max_paginas = paginas_disponiveis
-        
-        # Coletar notícias com paginação
-        noticias = scraper.coletar_noticias_inovaweek(
-            max_paginas=args.max_paginas,
-            somente_primeira_pagina=args.apenas_primeira_pagina
-        )
+                # Ajustar max_paginas se necessário
+                if args.max_paginas > paginas_disponiveis:
+                    print(f"⚠️ Ajustando max-paginas de {args.max_paginas} para {paginas_disponiveis}")
+                    args.max_paginas = paginas_disponiveis
+        
+            # Coletar notícias com paginação
+            noticias = scraper.coletar_noticias_inovaweek(
+                max_paginas=args.max_paginas,
+                somente_primeira_pagina=args.apenas_primeira_pagina,
+                checkpoint_path=args.checkpoint
+            )
         
-        if noticias:
-            # Exportar CSV
-            arquivo_csv = scraper.exportar_csv(args.output)
+            if noticias:
+                # Exportar CSV
+                arquivo_csv = scraper.exportar_csv(args.output)
             
-            # Gerar relatório
-            scraper.gerar_relatorio()
+                # Gerar relatório
+                scraper.gerar_relatorio()
             
-            print(f"\n✅ Scraping concluído com sucesso!")
-            print(f"📊 Total coletado: {len(noticias)} notícias do InovaWeek")
-            print(f"💾 Arquivo gerado: {arquivo_csv}")
-        else:
-            print("⚠️ Nenhuma notícia do InovaWeek encontrada no período especificado")
+                print(f"\n✅ Scraping concluído com sucesso!")
+                print(f"📊 Total coletado: {len(noticias)} notícias do InovaWeek")
+                print(f"💾 Arquivo gerado: {arquivo_csv}")
+            else:
+                print("⚠️ Nenhuma notícia do InovaWeek encontrada no período especificado")
         
     except KeyboardInterrupt:
         print(f"\n⚠️ Scraping interrompido pelo usuário")
     except Exception as e:
         print(f"\n❌ Erro durante o scraping: {e}")
         sys.exit(1)
+    finally:
+        listener_log.stop()
 
 
 if __name__ == "__main__":
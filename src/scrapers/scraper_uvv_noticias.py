@@ -21,15 +21,337 @@ URL Alvo: https://www.uvv.br/noticias/
 
 # === IMPORTAÇÕES NECESSÁRIAS ===
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
 import pandas as pd
 import json
 import csv
+import codecs
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 import time
 import re
-from collections import defaultdict
+import os
+import sys
+import threading
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Parser do BeautifulSoup: lxml (libxml2, em C) quando instalado, com
+# fallback para o html.parser da biblioteca padrão
+try:
+    import lxml  # noqa: F401
+    _PARSER_HTML = 'lxml'
+except ImportError:
+    _PARSER_HTML = 'html.parser'
+
+# selectolax (lexbor, em C) é opcional: quando instalado, a listagem de
+# notícias é percorrida com ele; sem ele (ou se falhar) usa o BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# requests-cache é opcional: quando instalado, as páginas ficam num cache
+# SQLite e são revalidadas com ETag/Last-Modified; sem ele, Session comum
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# orjson (em Rust) é opcional: quando instalado, o JSON de saída é gerado
+# por ele, que já serializa dataclasses e datetime; sem ele, json padrão
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logger do módulo: mensagens por requisição, card e página de notícia saem
+# por aqui em vez de print(), podendo ser filtradas por nível sem custo de
+# formatação
+logger = logging.getLogger(__name__)
+
+
+# === PADRÕES DE DATA ===
+
+# Mapeamento de meses em português
+_MESES_PT = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
+    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
+    'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+}
+
+# Nomes dos meses como alternância, para embutir nas regex de data
+_MESES_ALTERNACAO = '|'.join(_MESES_PT)
+
+# Todos os formatos numa única alternância compilada (o texto é varrido uma
+# só vez); o grupo nomeado que casou indica a ordem dos campos
+_DATA_RE = re.compile(
+    r'(?P<ymd>(\d{4})-(\d{1,2})-(\d{1,2}))'                          # yyyy-mm-dd
+    r'|(?P<dmy>(\d{1,2})[/\-.](\d{1,2})[/\-.](\d{4}))'               # dd/mm/yyyy, dd-mm-yyyy, dd.mm.yyyy
+    r'|(?P<dmony>(\d{1,2}) de (' + _MESES_ALTERNACAO + r') de (\d{4}))'  # dd de mês de yyyy
+    r'|(?P<setembro>setembro de (\d{4}))',                            # setembro de yyyy
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_data_texto(texto):
+    """
+    Converte a primeira data válida encontrada no texto para datetime.
+    
+    Memoizada: o mesmo texto de data (ex.: "setembro de 2025") costuma se
+    repetir em vários cards e páginas.
+    
+    Args:
+        texto (str): Texto que pode conter uma data
+        
+    Returns:
+        datetime or None: Data convertida ou None se não encontrar
+    """
+    for match in _DATA_RE.finditer(texto):
+        # Grupos do ramo que casou: o próprio ramo seguido dos seus campos
+        _, *campos = [grupo for grupo in match.groups() if grupo is not None]
+        formato = match.lastgroup
+        
+        try:
+            if formato == 'ymd':
+                ano, mes, dia = campos
+                return datetime(int(ano), int(mes), int(dia))
+            elif formato == 'dmy':
+                dia, mes, ano = campos
+                return datetime(int(ano), int(mes), int(dia))
+            elif formato == 'dmony':
+                dia, mes_nome, ano = campos
+                return datetime(int(ano), _MESES_PT[mes_nome.lower()], int(dia))
+            else:
+                # Apenas "setembro de yyyy": assumir dia 1 de setembro
+                return datetime(int(campos[0]), 9, 1)
+        except ValueError:
+            continue
+    
+    return None
+
+
+# === PALAVRAS-CHAVE ===
+
+# Palavras-chave que marcam uma notícia como do Inova UVV
+_PALAVRAS_INOVA = frozenset({
+    'inovaweek', 'inova week', 'inova', 'inovação', 'pesquisa', 'ciência',
+    'tecnologia', 'inovador', 'startup', 'empreendedorismo', 'desenvolvimento',
+    'projeto', 'laboratório', 'extensão'
+})
+
+# As mesmas palavras numa única alternância compilada: o texto do card é
+# varrido uma vez e a busca para no primeiro acerto
+_PALAVRAS_INOVA_RE = re.compile(
+    '|'.join(re.escape(palavra) for palavra in sorted(_PALAVRAS_INOVA, key=len, reverse=True))
+)
+
+# Menção a "inova" em qualquer caixa (usada no debug da estrutura da listagem)
+_INOVA_RE = re.compile(r'inova', re.IGNORECASE)
+
+
+# === LIMPEZA DAS PÁGINAS DE NOTÍCIA ===
+
+# Só o <body> das páginas de notícia vira árvore: o <head> (meta, link,
+# script, style) nunca é consultado. Um filtro por nome de tag não serve
+# aqui porque o SoupStrainer descarta só a tag que não casa e mantém os
+# filhos, o que soltaria o conteúdo de nav/header/footer na árvore sem o
+# container que _ELEMENTOS_REMOVER usa para removê-lo
+_CORPO_STRAINER = SoupStrainer('body')
+
+# Elementos removidos da página antes de extrair o conteúdo: scripts,
+# navegação, widgets, compartilhamento, comentários e publicidade
+_ELEMENTOS_REMOVER = (
+    'script', 'style', 'noscript', 'form',
+    'iframe[src*="facebook"]', 'iframe[src*="twitter"]', 'iframe[src*="instagram"]',
+    'nav', 'header', 'footer', 'aside',
+    '.menu', '.navigation', '.nav', '.breadcrumb', '.sidebar', '.widget',
+    '.social-share', '.social-media', '.share-buttons',
+    '.comments', '.comments-section', '.related-posts',
+    '.tags', '.categories', '.author-info',
+    '.advertisement', '.ads', '.cookie-notice', '.newsletter'
+)
+
+# Classes que indicam containers de navegação (ignorados na pontuação de
+# containers por número de palavras), numa única regex
+_CLASSES_NAVEGACAO_RE = re.compile(r'menu|nav|header|footer|sidebar|widget')
+
+
+# === FILTROS DE MENU E NAVEGAÇÃO ===
+
+# Palavras típicas de menu e navegação (busca por substring)
+_PALAVRAS_MENU = (
+    'institucional', 'cpa', 'trabalhe conosco', 'graduação', 'pós graduação',
+    'mestrado', 'doutorado', 'capacitação', 'pesquisa', 'extensão',
+    'serviços', 'comunidade', 'quero abrir', 'saiba mais', 'notícias',
+    'eventos', 'blog', 'contato', 'portal', 'manual', 'diploma',
+    'bolsas', 'financiamentos', 'a uvv', 'cursos', 'residência'
+)
+
+# Todas as palavras numa única alternância compilada: cada linha é varrida
+# uma vez pelo motor de regex em vez de uma busca por palavra
+_PALAVRAS_MENU_RE = re.compile(
+    '|'.join(re.escape(palavra) for palavra in _PALAVRAS_MENU), re.IGNORECASE
+)
+
+# Textos específicos que aparecem na navegação da UVV (comparação exata)
+_TEXTOS_NAVEGACAO_UVV = frozenset({
+    'A UVV',
+    'Institucional',
+    'CPA', 
+    'Manual da marca',
+    'Trabalhe conosco',
+    'Cursos',
+    'Graduação',
+    'MBA e Pós Graduação',
+    'Residência',
+    'Mestrado e Doutorado',
+    'Capacitação',
+    'Pesquisa e extensão',
+    'Pesquisa',
+    'Extensão',
+    'Serviços para a comunidade',
+    'Quero abrir um polo',
+    'Saiba mais',
+    'Notícias',
+    'Eventos',
+    'Blog',
+    'Contato',
+    'Portal do Aluno',
+    'Biblioteca',
+    'Webmail'
+})
+_TEXTOS_NAVEGACAO_UVV_MINUSCULOS = frozenset(texto.lower() for texto in _TEXTOS_NAVEGACAO_UVV)
+
+# Imagens de logos e ícones (busca no src), numa única alternância compilada
+_IMAGENS_DECORATIVAS_RE = re.compile(r'logo|icon|favicon|button', re.IGNORECASE)
+
+# Plataformas de vídeo reconhecidas nos iframes (busca no src)
+_PLATAFORMAS_VIDEO_RE = re.compile(r'youtube|vimeo|dailymotion', re.IGNORECASE)
+
+# Trechos típicos de rodapé (direitos autorais, políticas), em minúsculas;
+# parágrafos que os contêm não são conteúdo da notícia
+_PALAVRAS_RODAPE = (
+    'copyright', '©', 'todos os direitos', 'reserved', 'política de privacidade',
+    'termos de uso', 'cookies', 'desenvolvido por'
+)
+
+
+# === ACESSO A NÓS (BeautifulSoup ou selectolax) ===
+# Os elementos de notícia podem vir de qualquer um dos dois parsers; estas
+# funções escondem a diferença de API entre Tag e LexborNode.
+
+def _texto_no(no, separador='', strip=False):
+    """Texto completo do nó, incluindo descendentes (como get_text)."""
+    if isinstance(no, Tag):
+        return no.get_text(separador, strip=strip)
+    return no.text(separator=separador, strip=strip)
+
+
+def _buscar_no(no, seletor):
+    """Primeiro descendente que casa com o seletor CSS (ou None)."""
+    if isinstance(no, Tag):
+        return no.select_one(seletor)
+    primeiro = no.css_first(seletor)
+    if primeiro is None or isinstance(no, LexborHTMLParser) or primeiro.mem_id != no.mem_id:
+        return primeiro
+    # O próprio nó casou (ver _buscar_todos): o primeiro descendente é o seguinte
+    encontrados = _buscar_todos(no, seletor)
+    return encontrados[0] if encontrados else None
+
+
+def _buscar_todos(no, seletor):
+    """Todos os descendentes que casam com o seletor CSS, em ordem do documento."""
+    if isinstance(no, Tag):
+        return no.select(seletor)
+    encontrados = no.css(seletor)
+    # Num nó, o lexbor inclui o próprio nó (primeiro, em ordem do documento)
+    # quando ele casa com o seletor; o select do BeautifulSoup só considera
+    # os descendentes
+    if (encontrados and not isinstance(no, LexborHTMLParser)
+            and encontrados[0].mem_id == no.mem_id):
+        return encontrados[1:]
+    return encontrados
+
+
+def _attr_no(no, nome):
+    """Valor de um atributo do nó (ou None)."""
+    return no.get(nome) if isinstance(no, Tag) else no.attributes.get(nome)
+
+
+def _chave_no(no):
+    """
+    Identidade estável do nó, para deduplicação em conjuntos.
+    
+    Tags do BeautifulSoup são objetos persistentes (id() basta); o selectolax
+    cria um objeto Python novo a cada consulta, então usa-se o endereço do
+    nó na árvore do lexbor (mem_id).
+    """
+    return id(no) if isinstance(no, Tag) else no.mem_id
+
+
+def _pai_no(no, tags):
+    """Ancestral mais próximo cuja tag está em tags (ou None)."""
+    pai = no.parent
+    while pai is not None:
+        if (pai.name if isinstance(pai, Tag) else pai.tag) in tags:
+            return pai
+        pai = pai.parent
+    return None
+
+
+# === REGISTRO DE NOTÍCIA ===
+
+@dataclass(slots=True)
+class Noticia:
+    """
+    Dados de uma notícia coletada.
+    
+    Com slots cada instância dispensa o dict de atributos: alocar um registro
+    por card candidato sai mais barato que montar um dict de 15 chaves. Na
+    exportação não há conversão prévia para dict: o orjson serializa a
+    dataclass diretamente, o json padrão monta um dict raso por notícia via
+    _para_json no momento da escrita, e o CSV lê os atributos em tupla.
+    """
+    titulo: str = ''
+    resumo: str = ''
+    data_publicacao: datetime | None = None
+    data_publicacao_texto: str = ''
+    link: str = ''
+    categoria: str = ''
+    autor: str = ''
+    tags: list = field(default_factory=list)
+    eh_inova: bool = False
+    url_fonte: str = ''
+    timestamp_coleta: str = ''
+    conteudo_completo: str = ''
+    imagens: list = field(default_factory=list)
+    videos: list = field(default_factory=list)
+    links_relacionados: list = field(default_factory=list)
+
+
+
+def _para_json(obj):
+    """
+    Serializa para o json padrão o que ele não conhece (hook default=).
+    
+    Cada Noticia vira um dict raso só no momento em que é escrita, sem
+    copiar a lista inteira antes do dump; datetime vira texto ISO 8601.
+    """
+    if isinstance(obj, Noticia):
+        return {campo.name: getattr(obj, campo.name) for campo in fields(obj)}
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
 
 class UVVNoticiasScraper:
     """
@@ -41,8 +363,57 @@ class UVVNoticiasScraper:
     - Metadados completos de cada notícia
     """
     
-    def __init__(self):
-        """Inicializa o scraper da UVV com configurações específicas."""
+    # Seletores específicos para o site da UVV baseados na estrutura observada
+    SELETORES_NOTICIAS = (
+        # Seletores específicos da UVV
+        '.col-md-3',  # Cards de notícias na grid
+        '.card',      # Cards individuais
+        '.row .col-md-3',  # Colunas com notícias
+        'div[class*="col-"]',  # Qualquer coluna
+        
+        # Seletores gerais
+        'article',
+        '.noticia',
+        '.news',
+        '.post', 
+        '.entry',
+        '.item-noticia',
+        '.news-item',
+        'div[class*="noticia"]',
+        'div[class*="news"]'
+    )
+    SELETOR_NOTICIAS = ', '.join(SELETORES_NOTICIAS)
+    
+    # Fallback: divs com imagem e título (h1-h6 ou link), resolvido pelo
+    # próprio motor CSS em vez de um teste em Python para cada div
+    SELETOR_DIV_IMAGEM_TITULO = 'div:has(img):has(h1, h2, h3, h4, h5, h6, a)'
+    
+    # Atributos que podem trazer a data em ISO 8601, na ordem de preferência
+    ATRIBUTOS_DATA = ('datetime', 'data-date', 'data-time', 'data-created')
+    
+    # Só os time/span/div que têm algum desses atributos: o motor CSS descarta
+    # os demais em vez de consultar quatro atributos de cada nó em Python
+    SELETOR_ATRIBUTOS_DATA = ', '.join(
+        f'{tag}[{attr}]' for attr in ATRIBUTOS_DATA for tag in ('time', 'span', 'div')
+    )
+    
+    # Tamanho máximo aceito para uma página (corpo já descomprimido)
+    TAMANHO_MAXIMO_BYTES = 5 * 1024 * 1024
+    
+    # Limites de imagens e links relacionados guardados por notícia
+    MAX_IMAGENS = 10
+    MAX_LINKS_RELACIONADOS = 5
+    
+    def __init__(self, max_concorrencia=5, requisicoes_por_segundo=1.0, usar_cache=True, debug=False):
+        """
+        Inicializa o scraper da UVV com configurações específicas.
+        
+        Args:
+            max_concorrencia (int): Páginas de notícia baixadas em paralelo
+            requisicoes_por_segundo (float): Ritmo máximo de requisições por domínio
+            usar_cache (bool): Usar o cache HTTP em disco (se requests-cache estiver instalado)
+            debug (bool): Mostrar a estrutura HTML da primeira página de listagem
+        """
         self.base_url = "https://www.uvv.br"
         self.noticias_url = "https://www.uvv.br/noticias/"
         
@@ -51,15 +422,48 @@ class UVVNoticiasScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Só as codificações que o urllib3 consegue descomprimir aqui
+            # (inclui 'br' quando brotli/brotlicffi está instalado)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
         
-        # Session para manter cookies e conexões
-        self.session = requests.Session()
+        # Session para manter cookies e conexões; com requests-cache, páginas
+        # já baixadas são lidas do disco (uvv_cache.sqlite) e revalidadas
+        # com requisições condicionais após expirar. O cache lê o corpo
+        # inteiro antes de gravar, então só entram respostas que declaram
+        # Content-Length dentro do limite (as demais passam sem cache e são
+        # lidas em blocos por _ler_corpo_limitado)
+        if usar_cache and requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                'uvv_cache',
+                backend='sqlite',
+                expire_after=timedelta(hours=6),
+                allowable_codes=(200,),
+                stale_if_error=True,
+                filter_fn=self._tamanho_declarado_no_limite
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.headers)
         
+        # Pool de conexões grande o bastante para as buscas concorrentes
+        adapter = HTTPAdapter(pool_maxsize=max(10, max_concorrencia))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Concorrência e ritmo: cada domínio recebe no máximo
+        # requisicoes_por_segundo, mesmo com várias threads baixando ao mesmo tempo
+        self.max_concorrencia = max_concorrencia
+        self.requisicoes_por_segundo = requisicoes_por_segundo
+        
+        # O debug da estrutura monta uma segunda árvore da listagem; só
+        # quando pedido
+        self.debug = debug
+        self._proxima_requisicao = defaultdict(float)
+        self._lock_ritmo = threading.Lock()
+        
         # Armazenamento das notícias coletadas
         self.noticias = []
         
@@ -74,6 +478,101 @@ class UVVNoticiasScraper:
         print(f"📅 Coletando notícias de setembro/{self.ano_alvo}")
         print(f"🕐 Scraping iniciado em: {self.timestamp_scraping.strftime('%d/%m/%Y %H:%M:%S')}")
     
+    def _aguardar_vez(self, url):
+        """
+        Espera a vez da requisição no ritmo do domínio (token bucket de capacidade 1).
+        
+        Args:
+            url (str): URL que será requisitada
+        """
+        dominio = urlparse(url).netloc
+        
+        # Reservar o próximo horário livre sob o lock e dormir fora dele,
+        # para que as outras threads possam reservar os seus
+        with self._lock_ritmo:
+            agora = time.monotonic()
+            inicio = max(agora, self._proxima_requisicao[dominio])
+            self._proxima_requisicao[dominio] = inicio + 1 / self.requisicoes_por_segundo
+        
+        if inicio > agora:
+            time.sleep(inicio - agora)
+    
+    def _em_cache(self, url):
+        """
+        Verifica se a URL já está no cache do requests-cache.
+        
+        Entradas expiradas também contam: a revalidação é uma requisição
+        condicional, normalmente respondida com 304 e sem corpo.
+        
+        Args:
+            url (str): URL que será requisitada
+            
+        Returns:
+            bool: True se a session é uma CachedSession que já guarda a URL
+        """
+        if requests_cache is None or not isinstance(self.session, requests_cache.CachedSession):
+            return False
+        try:
+            return self.session.cache.contains(url=url)
+        except Exception as e:
+            logger.debug("⚠️ Erro ao consultar o cache para %s: %s", url, e)
+            return False
+    
+    def _ler_corpo_limitado(self, response):
+        """
+        Lê o corpo de uma resposta em stream até TAMANHO_MAXIMO_BYTES.
+        
+        Args:
+            response (requests.Response): Resposta obtida com stream=True
+            
+        Returns:
+            bytes or None: Corpo da resposta ou None se passar do limite
+        """
+        # Content-Length declarado já acima do limite: nem começar a ler
+        tamanho_declarado = response.headers.get('Content-Length', '')
+        if tamanho_declarado.isdecimal() and int(tamanho_declarado) > self.TAMANHO_MAXIMO_BYTES:
+            return None
+        
+        corpo = bytearray()
+        for bloco in response.iter_content(chunk_size=64 * 1024):
+            corpo += bloco
+            if len(corpo) > self.TAMANHO_MAXIMO_BYTES:
+                return None
+        
+        return bytes(corpo)
+    
+    def _tamanho_declarado_no_limite(self, response):
+        """
+        Filtro do requests-cache: só grava respostas com Content-Length dentro do limite.
+        
+        Args:
+            response (requests.Response): Resposta recebida do servidor
+            
+        Returns:
+            bool: True se o corpo declarado cabe em TAMANHO_MAXIMO_BYTES
+        """
+        tamanho_declarado = response.headers.get('Content-Length', '')
+        return tamanho_declarado.isdecimal() and int(tamanho_declarado) <= self.TAMANHO_MAXIMO_BYTES
+    
+    def _url_absoluta(self, caminho):
+        """
+        Resolve um caminho iniciado por '/' contra base_url.
+        
+        Mesmo resultado de urljoin(self.base_url, caminho) (a base não tem
+        caminho próprio), mas o urljoin, que analisa as duas URLs em Python,
+        só é usado para '//host/...' ou segmentos '.'/'..' a normalizar; no
+        caso comum basta concatenar.
+        
+        Args:
+            caminho (str): Caminho absoluto no site (começa com '/')
+            
+        Returns:
+            str: URL completa
+        """
+        if caminho.startswith('//') or '/.' in caminho:
+            return urljoin(self.base_url, caminho)
+        return self.base_url + caminho
+    
     def fazer_requisicao(self, url, timeout=30):
         """
         Faz requisição HTTP com tratamento de erros.
@@ -85,17 +584,41 @@ class UVVNoticiasScraper:
         Returns:
             requests.Response or None: Resposta ou None se erro
         """
+        response = None
         try:
-            print(f"🔍 Fazendo requisição: {url}")
-            response = self.session.get(url, timeout=timeout)
+            # Respostas vindas do cache local não passam pelo ritmo do domínio
+            # (como no scraper InovaWeek, só requisições de rede esperam a vez)
+            if not self._em_cache(url):
+                self._aguardar_vez(url)
+            
+            logger.debug("🔍 Fazendo requisição: %s", url)
+            response = self.session.get(url, timeout=timeout, stream=True)
             response.raise_for_status()
             
-            print(f"✅ Status: {response.status_code} | Tamanho: {len(response.content)} bytes")
+            # Ler o corpo em blocos, abortando páginas grandes demais (memória
+            # limitada mesmo que o servidor envie muito mais que o esperado)
+            corpo = self._ler_corpo_limitado(response)
+            if corpo is None:
+                logger.warning("⚠️ Página acima de %d bytes - ignorando: %s", self.TAMANHO_MAXIMO_BYTES, url)
+                return None
+            response._content = corpo
+            
+            # Sem charset no Content-Type o requests assume ISO-8859-1; o site
+            # da UVV é UTF-8 (e assim o parser não precisa adivinhar)
+            if not response.encoding or response.encoding.upper() == 'ISO-8859-1':
+                response.encoding = 'utf-8'
+            
+            logger.debug("✅ Status: %s | Tamanho: %d bytes", response.status_code, len(response.content))
             return response
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ Erro na requisição para {url}: {e}")
+            logger.warning("❌ Erro na requisição para %s: %s", url, e)
             return None
+        finally:
+            # Devolve a conexão ao pool em qualquer saída (erro HTTP, corpo
+            # acima do limite ou sucesso, quando o corpo já está em memória)
+            if response is not None:
+                response.close()
     
     def extrair_data_noticia(self, elemento_data):
         """
@@ -110,45 +633,7 @@ class UVVNoticiasScraper:
         if not elemento_data:
             return None
         
-        texto_data = elemento_data.get_text().strip()
-        
-        # Padrões de data comuns em sites brasileiros
-        padroes_data = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',  # dd/mm/yyyy ou d/m/yyyy
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',  # dd-mm-yyyy
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # yyyy-mm-dd
-            r'(\d{1,2}) de (\w+) de (\d{4})', # dd de mês de yyyy
-        ]
-        
-        # Mapeamento de meses em português
-        meses_pt = {
-            'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
-            'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
-            'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-        }
-        
-        for padrao in padroes_data:
-            match = re.search(padrao, texto_data.lower())
-            if match:
-                try:
-                    if 'de' in padrao:  # Formato "dd de mês de yyyy"
-                        dia, mes_nome, ano = match.groups()
-                        mes = meses_pt.get(mes_nome.lower())
-                        if mes:
-                            return datetime(int(ano), mes, int(dia))
-                    else:
-                        grupos = match.groups()
-                        if padrao.startswith(r'(\d{4})'):  # yyyy-mm-dd
-                            ano, mes, dia = grupos
-                        else:  # dd/mm/yyyy ou dd-mm-yyyy
-                            dia, mes, ano = grupos
-                        
-                        return datetime(int(ano), int(mes), int(dia))
-                
-                except ValueError:
-                    continue
-        
-        return None
+        return _parse_data_texto(_texto_no(elemento_data).strip())
     
     def eh_noticia_setembro(self, data_noticia):
         """
@@ -166,68 +651,59 @@ class UVVNoticiasScraper:
         return (data_noticia.month == self.mes_alvo and 
                 data_noticia.year == self.ano_alvo)
     
-    def extrair_noticias_pagina(self, html_content, url_pagina):
+    def extrair_noticias_pagina(self, html_content, url_pagina, encoding=None):
         """
         Extrai notícias de uma página específica.
         
         Args:
-            html_content (str): HTML da página
+            html_content (str or bytes): HTML da página
             url_pagina (str): URL da página atual
+            encoding (str): Encoding do HTML quando passado em bytes (opcional)
             
         Returns:
             list: Lista de notícias extraídas
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        raiz = self._parse_listagem(html_content, encoding)
         noticias_pagina = []
         
-        print(f"📄 Analisando página: {url_pagina}")
-        
-        # Seletores específicos para o site da UVV baseados na estrutura observada
-        seletores_noticias = [
-            # Seletores específicos da UVV
-            '.col-md-3',  # Cards de notícias na grid
-            '.card',      # Cards individuais
-            '.row .col-md-3',  # Colunas com notícias
-            'div[class*="col-"]',  # Qualquer coluna
-            
-            # Seletores gerais
-            'article',
-            '.noticia',
-            '.news',
-            '.post', 
-            '.entry',
-            '.item-noticia',
-            '.news-item',
-            'div[class*="noticia"]',
-            'div[class*="news"]'
-        ]
+        logger.debug("📄 Analisando página: %s", url_pagina)
         
         elementos_encontrados = []
+        # Nós já coletados (cada nó é processado uma única vez, mesmo que
+        # case com vários seletores); teste de pertinência O(1)
+        nos_vistos = set()
         
-        # Buscar elementos com diferentes seletores
-        for seletor in seletores_noticias:
-            elementos = soup.select(seletor)
-            elementos_encontrados.extend(elementos)
+        def adicionar(elemento):
+            chave = _chave_no(elemento)
+            if chave not in nos_vistos:
+                nos_vistos.add(chave)
+                elementos_encontrados.append(elemento)
+        
+        # Buscar elementos com todos os seletores numa única consulta: a árvore
+        # é percorrida uma vez e cada nó vem uma só vez, em ordem do documento
+        for elemento in _buscar_todos(raiz, self.SELETOR_NOTICIAS):
+            adicionar(elemento)
         
         # Estratégia mais agressiva: buscar por divs que contenham imagens + títulos
         if not elementos_encontrados:
-            divs_com_imagem = soup.find_all('div', lambda x: x and x.find('img'))
-            for div in divs_com_imagem:
-                # Verificar se tem título (h1, h2, h3, h4, h5, h6, a)
-                if div.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'a']):
-                    elementos_encontrados.append(div)
+            for elemento in _buscar_todos(raiz, self.SELETOR_DIV_IMAGEM_TITULO):
+                adicionar(elemento)
         
         # Buscar por links que contenham texto longo (possíveis títulos de notícias)
-        links_noticias = soup.find_all('a', href=True)
+        links_noticias = _buscar_todos(raiz, 'a[href]')
         for link in links_noticias:
-            texto_link = link.get_text().strip()
-            if len(texto_link) > 20 and ('inova' in texto_link.lower() or 'uvv' in texto_link.lower()):
+            texto_link = _texto_no(link).strip()
+            if len(texto_link) <= 20:
+                continue
+            # Minúsculas uma vez por link, só para os textos longos
+            texto_link_minusculo = texto_link.lower()
+            if 'inova' in texto_link_minusculo or 'uvv' in texto_link_minusculo:
                 # Encontrar o container pai do link
-                container = link.find_parent(['div', 'article', 'section'])
-                if container and container not in elementos_encontrados:
-                    elementos_encontrados.append(container)
+                container = _pai_no(link, ('div', 'article', 'section'))
+                if container:
+                    adicionar(container)
         
-        print(f"🔍 Encontrados {len(elementos_encontrados)} elementos candidatos a notícias")
+        logger.info("🔍 Encontrados %d elementos candidatos a notícias", len(elementos_encontrados))
         
         for i, elemento in enumerate(elementos_encontrados):
             try:
@@ -235,190 +711,188 @@ class UVVNoticiasScraper:
                 if noticia:
                     noticias_pagina.append(noticia)
             except Exception as e:
-                print(f"⚠️ Erro ao processar elemento {i}: {e}")
+                logger.warning("⚠️ Erro ao processar elemento %d: %s", i, e)
                 continue
         
         return noticias_pagina
     
+    def completar_noticias_inova(self, noticias):
+        """
+        Extrai o conteúdo completo das notícias Inova em paralelo.
+        
+        Cada link é baixado uma única vez, mesmo que apareça em vários cards;
+        o ritmo por domínio é garantido por fazer_requisicao.
+        
+        Args:
+            noticias (list): Notícias coletadas (atualizadas no lugar)
+        """
+        noticias_por_link = defaultdict(list)
+        for noticia in noticias:
+            if noticia.eh_inova and noticia.link:
+                noticias_por_link[noticia.link].append(noticia)
+        
+        if not noticias_por_link:
+            return
+        
+        logger.info("🔬 Coletando conteúdo completo de %d notícias Inova (%d em paralelo)...",
+                    len(noticias_por_link), self.max_concorrencia)
+        
+        # requests é bloqueante: cada página roda numa thread do pool,
+        # todas compartilhando a mesma session
+        links = list(noticias_por_link)
+        with ThreadPoolExecutor(max_workers=self.max_concorrencia) as executor:
+            resultados = list(executor.map(self.extrair_conteudo_completo, links))
+        
+        for link, conteudo_completo in zip(links, resultados):
+            if conteudo_completo:
+                for noticia in noticias_por_link[link]:
+                    for campo, valor in conteudo_completo.items():
+                        setattr(noticia, campo, valor)
+    
+    def _parse_listagem(self, html_content, encoding=None):
+        """
+        Monta a árvore da página de listagem, preferindo o selectolax.
+        
+        Args:
+            html_content (str or bytes): HTML da página
+            encoding (str): Encoding do HTML quando passado em bytes (opcional)
+            
+        Returns:
+            LexborHTMLParser or BeautifulSoup: Árvore pronta para consultas CSS
+        """
+        if LexborHTMLParser is not None:
+            try:
+                # O lexbor lê bytes como UTF-8: nesse caso (o do site da UVV)
+                # o corpo vai direto, sem montar antes uma str da página inteira
+                if isinstance(html_content, bytes) and codecs.lookup(encoding or 'utf-8').name != 'utf-8':
+                    html_content = html_content.decode(encoding, errors='replace')
+                return LexborHTMLParser(html_content)
+            except Exception as e:
+                logger.warning("⚠️ selectolax falhou (%s) - usando BeautifulSoup", e)
+        
+        return BeautifulSoup(html_content, _PARSER_HTML, from_encoding=encoding)
+    
     def processar_elemento_noticia(self, elemento, url_pagina):
         """
         Processa um elemento individual de notícia.
         
         Args:
-            elemento: Elemento BeautifulSoup
+            elemento: Elemento BeautifulSoup (Tag) ou selectolax (LexborNode)
             url_pagina (str): URL da página atual
             
         Returns:
-            dict or None: Dados da notícia ou None se inválida
+            Noticia or None: Dados da notícia ou None se inválida
         """
-        noticia = {
-            'titulo': '',
-            'resumo': '',
-            'data_publicacao': None,
-            'data_publicacao_texto': '',
-            'link': '',
-            'categoria': '',
-            'autor': '',
-            'tags': [],
-            'eh_inova': False,
-            'url_fonte': url_pagina,
-            'timestamp_coleta': self.timestamp_scraping.isoformat(),
-            'conteudo_completo': '',
-            'imagens': [],
-            'videos': [],
-            'links_relacionados': []
-        }
+        noticia = Noticia(url_fonte=url_pagina, timestamp_coleta=self.timestamp_scraping.isoformat())
         
         # Extrair título
         titulo_elem = None
         for seletor in ['h1', 'h2', 'h3', '.titulo', '.title', '.headline', 'a']:
-            titulo_elem = elemento.find(seletor)
+            titulo_elem = _buscar_no(elemento, seletor)
             if titulo_elem:
                 break
         
         if titulo_elem:
-            noticia['titulo'] = titulo_elem.get_text().strip()
+            noticia.titulo = _texto_no(titulo_elem).strip()
         
         # Filtrar títulos muito curtos ou vazios
-        if len(noticia['titulo']) < 10:
+        if len(noticia.titulo) < 10:
             return None
         
+        # Texto do card extraído uma única vez (a subárvore é percorrida só
+        # aqui) e reaproveitado na detecção do Inova e no fallback de data
+        texto_completo = _texto_no(elemento, ' ', strip=True)
+        texto_minusculo = texto_completo.casefold()
+        
         # Verificar se é notícia do Inova UVV (com mais palavras-chave)
-        texto_completo = elemento.get_text().lower()
-        palavras_inova = [
-            'inovaweek', 'inova week', 'inova', 'inovação', 'pesquisa', 'ciência',
-            'tecnologia', 'inovador', 'startup', 'empreendedorismo', 'desenvolvimento',
-            'projeto', 'laboratório', 'extensão'
-        ]
-        if any(palavra in texto_completo for palavra in palavras_inova):
-            noticia['eh_inova'] = True
+        if _PALAVRAS_INOVA_RE.search(texto_minusculo):
+            noticia.eh_inova = True
         
         # Extrair link
-        link_elem = elemento.find('a')
-        if link_elem and link_elem.get('href'):
-            link = link_elem.get('href')
+        link_elem = _buscar_no(elemento, 'a')
+        if link_elem and _attr_no(link_elem, 'href'):
+            link = _attr_no(link_elem, 'href')
             if link.startswith('/'):
-                link = urljoin(self.base_url, link)
-            noticia['link'] = link
+                link = self._url_absoluta(link)
+            noticia.link = link
         
         # Extrair resumo/descrição
         resumo_selectors = ['.resumo', '.excerpt', '.description', 'p', '.lead']
         for seletor in resumo_selectors:
-            resumo_elem = elemento.find(seletor)
+            resumo_elem = _buscar_no(elemento, seletor)
             if resumo_elem:
-                resumo_texto = resumo_elem.get_text().strip()
+                resumo_texto = _texto_no(resumo_elem).strip()
                 if len(resumo_texto) > 20 and len(resumo_texto) < 500:
-                    noticia['resumo'] = resumo_texto
+                    noticia.resumo = resumo_texto
                     break
         
         # Extrair data
         data_selectors = ['.data', '.date', '.published', '.time', 'time']
         for seletor in data_selectors:
-            data_elem = elemento.find(seletor)
+            data_elem = _buscar_no(elemento, seletor)
             if data_elem:
-                noticia['data_publicacao_texto'] = data_elem.get_text().strip()
+                noticia.data_publicacao_texto = _texto_no(data_elem).strip()
                 data_convertida = self.extrair_data_noticia(data_elem)
                 if data_convertida:
-                    noticia['data_publicacao'] = data_convertida
+                    noticia.data_publicacao = data_convertida
                     break
         
         # Se não encontrou data específica, tentar extrair do texto e atributos
-        if not noticia['data_publicacao']:
-            texto_elemento = elemento.get_text()
+        if not noticia.data_publicacao:
             
             # Buscar atributos datetime, data-date, etc.
-            for elem in elemento.find_all(['time', 'span', 'div']):
-                for attr in ['datetime', 'data-date', 'data-time', 'data-created']:
-                    if elem.get(attr):
-                        data_attr = elem.get(attr)
+            for elem in _buscar_todos(elemento, self.SELETOR_ATRIBUTOS_DATA):
+                for attr in self.ATRIBUTOS_DATA:
+                    if _attr_no(elem, attr):
+                        data_attr = _attr_no(elem, attr)
                         try:
                             # Tentar parsear ISO format
                             if 'T' in data_attr:
                                 data_encontrada = datetime.fromisoformat(data_attr.replace('Z', ''))
-                                noticia['data_publicacao'] = data_encontrada
-                                noticia['data_publicacao_texto'] = data_encontrada.strftime('%d/%m/%Y')
+                                noticia.data_publicacao = data_encontrada
+                                noticia.data_publicacao_texto = data_encontrada.strftime('%d/%m/%Y')
                                 break
                         except ValueError:
                             continue
-                if noticia['data_publicacao']:
+                if noticia.data_publicacao:
                     break
             
             # Se ainda não encontrou, buscar padrões de data no texto
-            if not noticia['data_publicacao']:
-                padroes_texto = [
-                    r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})',  # dd/mm/yyyy
-                    r'(\d{1,2}) de (\w+) de (\d{4})',          # dd de mês de yyyy
-                    r'(\d{1,2})\.(\d{1,2})\.(\d{4})',          # dd.mm.yyyy
-                    r'setembro de (\d{4})',                     # setembro de yyyy
-                    r'(\d{4})-(\d{1,2})-(\d{1,2})'             # yyyy-mm-dd
-                ]
-                
-                for padrao in padroes_texto:
-                    match = re.search(padrao, texto_elemento.lower())
-                    if match:
-                        try:
-                            if 'setembro de' in padrao:
-                                ano = int(match.group(1))
-                                # Assumir dia 1 de setembro
-                                data_encontrada = datetime(ano, 9, 1)
-                            elif 'de' in padrao:
-                                dia, mes_nome, ano = match.groups()
-                                meses_pt = {
-                                    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
-                                    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
-                                    'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-                                }
-                                mes = meses_pt.get(mes_nome.lower())
-                                if mes:
-                                    data_encontrada = datetime(int(ano), mes, int(dia))
-                            else:
-                                grupos = match.groups()
-                                if padrao.startswith(r'(\d{4})'):  # yyyy-mm-dd
-                                    ano, mes, dia = grupos
-                                else:  # dd/mm/yyyy variants
-                                    dia, mes, ano = grupos
-                                data_encontrada = datetime(int(ano), int(mes), int(dia))
-                            
-                            noticia['data_publicacao'] = data_encontrada
-                            noticia['data_publicacao_texto'] = data_encontrada.strftime('%d/%m/%Y')
-                            break
-                        except ValueError:
-                            continue
+            if not noticia.data_publicacao:
+                data_encontrada = _parse_data_texto(texto_completo)
+                if data_encontrada:
+                    noticia.data_publicacao = data_encontrada
+                    noticia.data_publicacao_texto = data_encontrada.strftime('%d/%m/%Y')
         
         # Verificar se é de setembro 2025 (mais flexível para incluir notícias sem data)
-        if noticia['data_publicacao'] and not self.eh_noticia_setembro(noticia['data_publicacao']):
+        if noticia.data_publicacao and not self.eh_noticia_setembro(noticia.data_publicacao):
             # Se tem data mas não é de setembro, verificar se é notícia do Inova (pode ser relevante)
-            if not noticia['eh_inova']:
-                print(f"📅 Notícia de {noticia['data_publicacao'].strftime('%m/%Y')} - pulando (fora de setembro/2025)")
+            if not noticia.eh_inova:
+                logger.debug("📅 Notícia de %02d/%d - pulando (fora de setembro/2025)",
+                             noticia.data_publicacao.month, noticia.data_publicacao.year)
                 return None
             else:
-                print(f"🔬 Notícia Inova de {noticia['data_publicacao'].strftime('%m/%Y')} - incluindo mesmo fora de setembro")
-        elif not noticia['data_publicacao']:
-            print(f"📅 Notícia sem data identificada - incluindo para análise manual")
+                logger.debug("🔬 Notícia Inova de %02d/%d - incluindo mesmo fora de setembro",
+                             noticia.data_publicacao.month, noticia.data_publicacao.year)
+        elif not noticia.data_publicacao:
+            logger.debug("📅 Notícia sem data identificada - incluindo para análise manual")
         
         # Extrair categoria
         categoria_selectors = ['.categoria', '.category', '.tag']
         for seletor in categoria_selectors:
-            cat_elem = elemento.find(seletor)
+            cat_elem = _buscar_no(elemento, seletor)
             if cat_elem:
-                noticia['categoria'] = cat_elem.get_text().strip()
+                noticia.categoria = _texto_no(cat_elem).strip()
                 break
         
         # Extrair autor
         autor_selectors = ['.autor', '.author', '.by']
         for seletor in autor_selectors:
-            autor_elem = elemento.find(seletor)
+            autor_elem = _buscar_no(elemento, seletor)
             if autor_elem:
-                noticia['autor'] = autor_elem.get_text().strip()
+                noticia.autor = _texto_no(autor_elem).strip()
                 break
         
-        # Se é uma notícia do InovaWeek, extrair conteúdo completo
-        if noticia['eh_inova'] and noticia['link']:
-            print(f"🔬 Coletando conteúdo completo da notícia Inova: {noticia['titulo'][:50]}...")
-            conteudo_completo = self.extrair_conteudo_completo(noticia['link'])
-            if conteudo_completo:
-                noticia.update(conteudo_completo)
-        
         return noticia
     
     def extrair_conteudo_completo(self, url_noticia):
@@ -432,16 +906,14 @@ class UVVNoticiasScraper:
             dict: Conteúdo completo extraído ou None se erro
         """
         try:
-            print(f"📄 Acessando página completa: {url_noticia}")
-            
-            # Aguardar um pouco para não sobrecarregar o servidor
-            time.sleep(1)
+            logger.debug("📄 Acessando página completa: %s", url_noticia)
             
             response = self.fazer_requisicao(url_noticia)
             if not response:
                 return None
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, _PARSER_HTML, from_encoding=response.encoding,
+                                 parse_only=_CORPO_STRAINER)
             
             conteudo = {
                 'conteudo_completo': '',
@@ -450,17 +922,10 @@ class UVVNoticiasScraper:
                 'links_relacionados': []
             }
             
-            # PRIMEIRO: Remover elementos que sabemos ser desnecessários
-            elementos_para_remover = [
-                'script', 'style', 'noscript', 'iframe[src*="facebook"]', 
-                'iframe[src*="twitter"]', 'iframe[src*="instagram"]',
-                'nav', 'header', 'footer', 'aside',
-                '.menu', '.navigation', '.nav', '.breadcrumb', '.sidebar',
-                '.social-share', '.comments', '.related-posts', '.widget',
-                '.advertisement', '.ads', '.cookie-notice', '.newsletter'
-            ]
-            
-            for seletor in elementos_para_remover:
+            # PRIMEIRO: Remover elementos que sabemos ser desnecessários (uma
+            # única vez, na página inteira; os candidatos a conteúdo abaixo
+            # já são lidos da árvore limpa)
+            for seletor in _ELEMENTOS_REMOVER:
                 for elemento in soup.select(seletor):
                     elemento.decompose()
             
@@ -497,78 +962,59 @@ class UVVNoticiasScraper:
             ]
             
             conteudo_texto = ""
-            print(f"   🔍 Tentando extrair conteúdo com seletores específicos...")
+            logger.debug("   🔍 Tentando extrair conteúdo com seletores específicos...")
             
             for seletor in conteudo_selectors:
                 elemento_conteudo = soup.select_one(seletor)
                 if elemento_conteudo:
-                    print(f"   ✅ Encontrou elemento com seletor: {seletor}")
-                    
-                    # Fazer uma cópia para não modificar o original
-                    elemento_temp = BeautifulSoup(str(elemento_conteudo), 'html.parser')
-                    
-                    # Remover elementos específicos que aparecem em páginas da UVV
-                    elementos_indesejaveis = [
-                        'script', 'style', 'nav', 'header', 'footer', 'aside', 'form',
-                        '.menu', '.navigation', '.breadcrumb', '.sidebar', '.widget',
-                        '.social-media', '.share-buttons', '.tags', '.categories',
-                        '.author-info', '.related-posts', '.comments-section'
-                    ]
-                    
-                    for seletor_remover in elementos_indesejaveis:
-                        for elem in elemento_temp.select(seletor_remover):
-                            elem.decompose()
+                    logger.debug("   ✅ Encontrou elemento com seletor: %s", seletor)
                     
                     # Extrair texto preservando estrutura de parágrafos
-                    paragrafos = elemento_temp.find_all(['p', 'div', 'span'], string=True)
+                    paragrafos = elemento_conteudo.find_all(['p', 'div', 'span'], string=True)
                     textos_paragrafos = []
                     
                     for p in paragrafos:
                         texto_p = p.get_text().strip()
                         if (texto_p and 
                             len(texto_p) > 20 and 
-                            not self._eh_linha_menu(texto_p) and
-                            not self._eh_texto_navegacao_uvv(texto_p)):
+                            not self._eh_linha_navegacao(texto_p)):
                             textos_paragrafos.append(texto_p)
                     
                     # Se encontrou parágrafos válidos, usar eles
                     if textos_paragrafos and len('\n\n'.join(textos_paragrafos)) > 200:
                         conteudo_texto = '\n\n'.join(textos_paragrafos)
-                        print(f"   ✅ Conteúdo extraído com {len(textos_paragrafos)} parágrafos")
+                        logger.debug("   ✅ Conteúdo extraído com %d parágrafos", len(textos_paragrafos))
                         break
                     
                     # Senão, tentar extração simples mas filtrada
                     else:
-                        conteudo_bruto = elemento_temp.get_text(separator='\n', strip=True)
+                        conteudo_bruto = elemento_conteudo.get_text(separator='\n', strip=True)
                         linhas = [linha.strip() for linha in conteudo_bruto.split('\n') if linha.strip()]
                         linhas_relevantes = []
                         
                         for linha in linhas:
                             if (len(linha) > 15 and 
-                                not self._eh_linha_menu(linha) and
-                                not self._eh_texto_navegacao_uvv(linha)):
+                                not self._eh_linha_navegacao(linha)):
                                 linhas_relevantes.append(linha)
                         
                         if len(linhas_relevantes) >= 3 and len('\n'.join(linhas_relevantes)) > 200:
                             conteudo_texto = '\n'.join(linhas_relevantes)
-                            print(f"   ✅ Conteúdo extraído com {len(linhas_relevantes)} linhas filtradas")
+                            logger.debug("   ✅ Conteúdo extraído com %d linhas filtradas", len(linhas_relevantes))
                             break
             
             # Se não encontrou com seletores específicos, tentar estratégias mais inteligentes
             if not conteudo_texto or len(conteudo_texto) < 200:
-                print(f"   🔍 Tentando estratégias alternativas para extrair conteúdo...")
+                logger.debug("   🔍 Tentando estratégias alternativas para extrair conteúdo...")
                 
                 # Estratégia 1: Procurar especificamente por parágrafos longos e relevantes
                 paragrafos_relevantes = []
                 for p in soup.find_all('p'):
                     texto_p = p.get_text().strip()
-                    if (len(texto_p) > 80 and  # Parágrafos mais longos
-                        not self._eh_linha_menu(texto_p) and
-                        not self._eh_texto_navegacao_uvv(texto_p) and
-                        not any(palavra in texto_p.lower() for palavra in [
-                            'copyright', '©', 'todos os direitos', 'reserved', 'política de privacidade',
-                            'termos de uso', 'cookies', 'desenvolvido por'
-                        ])):
+                    if len(texto_p) <= 80:  # Só parágrafos mais longos
+                        continue
+                    texto_p_minusculo = texto_p.lower()
+                    if (not self._eh_linha_navegacao(texto_p) and
+                        not any(palavra in texto_p_minusculo for palavra in _PALAVRAS_RODAPE)):
                         # Verificar se o parágrafo tem conteúdo substantivo
                         palavras = texto_p.split()
                         if len(palavras) >= 10:  # Pelo menos 10 palavras
@@ -576,21 +1022,26 @@ class UVVNoticiasScraper:
                 
                 if paragrafos_relevantes and len('\n\n'.join(paragrafos_relevantes)) > 200:
                     conteudo_texto = '\n\n'.join(paragrafos_relevantes)
-                    print(f"   ✅ Conteúdo extraído de {len(paragrafos_relevantes)} parágrafos relevantes")
+                    logger.debug("   ✅ Conteúdo extraído de %d parágrafos relevantes", len(paragrafos_relevantes))
                 
                 # Estratégia 2: Procurar por divs/sections com densidade alta de texto
                 if not conteudo_texto or len(conteudo_texto) < 200:
-                    print(f"   🔍 Analisando densidade de texto em containers...")
+                    logger.debug("   🔍 Analisando densidade de texto em containers...")
                     
                     candidatos_conteudo = []
                     for container in soup.find_all(['div', 'section', 'article']):
                         # Pular containers que são claramente navegação
-                        if any(classe in str(container.get('class', [])).lower() 
-                               for classe in ['menu', 'nav', 'header', 'footer', 'sidebar', 'widget']):
+                        if _CLASSES_NAVEGACAO_RE.search(' '.join(container.get('class', [])).lower()):
                             continue
                         
                         # Extrair texto do container
                         texto_container = container.get_text(separator=' ', strip=True)
+                        
+                        # Containers curtos saem sem separar o texto inteiro: com
+                        # maxsplit=49 o split para na 50ª palavra (qualquer espaço
+                        # em branco, como no split completo abaixo)
+                        if len(texto_container.split(maxsplit=49)) < 50:
+                            continue
                         palavras = texto_container.split()
                         
                         # Calcular métricas de qualidade do conteúdo
@@ -598,16 +1049,16 @@ class UVVNoticiasScraper:
                             # Verificar se não é majoritariamente navegação
                             linhas_texto = [l.strip() for l in texto_container.split('\n') if l.strip()]
                             linhas_navegacao = sum(1 for linha in linhas_texto 
-                                                 if self._eh_texto_navegacao_uvv(linha) or self._eh_linha_menu(linha))
+                                                 if self._eh_linha_navegacao(linha))
                             
                             # Se menos de 30% é navegação, é um bom candidato
                             if len(linhas_texto) > 0 and (linhas_navegacao / len(linhas_texto)) < 0.3:
-                                candidatos_conteudo.append((container, len(palavras), texto_container))
+                                candidatos_conteudo.append((len(palavras), texto_container))
                     
                     # Pegar o container com mais palavras (mais provável de ser o conteúdo principal)
                     if candidatos_conteudo:
-                        melhor_container = max(candidatos_conteudo, key=lambda x: x[1])
-                        conteudo_bruto = melhor_container[2]
+                        melhor_container = max(candidatos_conteudo, key=lambda x: x[0])
+                        conteudo_bruto = melhor_container[1]
                         
                         # Filtrar o conteúdo linha por linha
                         linhas_filtradas = []
@@ -615,17 +1066,16 @@ class UVVNoticiasScraper:
                             linha = linha.strip()
                             if (linha and 
                                 len(linha) > 20 and
-                                not self._eh_linha_menu(linha) and
-                                not self._eh_texto_navegacao_uvv(linha)):
+                                not self._eh_linha_navegacao(linha)):
                                 linhas_filtradas.append(linha)
                         
                         if linhas_filtradas and len('\n'.join(linhas_filtradas)) > 200:
                             conteudo_texto = '\n'.join(linhas_filtradas)
-                            print(f"   ✅ Conteúdo extraído do melhor container ({melhor_container[1]} palavras)")
+                            logger.debug("   ✅ Conteúdo extraído do melhor container (%d palavras)", melhor_container[0])
                 
                 # Estratégia 3: Fallback - buscar qualquer texto estruturado
                 if not conteudo_texto or len(conteudo_texto) < 200:
-                    print(f"   🔍 Estratégia fallback - busca de texto estruturado...")
+                    logger.debug("   🔍 Estratégia fallback - busca de texto estruturado...")
                     
                     # Procurar por qualquer elemento que tenha texto longo e não seja navegação
                     elementos_texto = soup.find_all(['div', 'section', 'article', 'main'])
@@ -640,20 +1090,22 @@ class UVVNoticiasScraper:
                         linhas_relevantes = []
                         for linha in linhas:
                             if (len(linha) > 25 and 
-                                not self._eh_linha_menu(linha) and
-                                not self._eh_texto_navegacao_uvv(linha)):
+                                not self._eh_linha_navegacao(linha)):
                                 linhas_relevantes.append(linha)
                         
                         # Se encontrou conteúdo relevante suficiente, usar
                         if len(linhas_relevantes) >= 5 and len('\n'.join(linhas_relevantes)) > 300:
                             conteudo_texto = '\n'.join(linhas_relevantes)
-                            print(f"   ✅ Conteúdo extraído com estratégia fallback ({len(linhas_relevantes)} linhas)")
+                            logger.debug("   ✅ Conteúdo extraído com estratégia fallback (%d linhas)", len(linhas_relevantes))
                             break
             
             conteudo['conteudo_completo'] = conteudo_texto
             
             # Extrair imagens relacionadas à notícia
             imagens = []
+            # Imagens já coletadas, como (src, alt, title): teste de duplicata
+            # O(1) em vez de comparar com cada dict da lista
+            imagens_vistas = set()
             for img in soup.find_all('img'):
                 src = img.get('src')
                 alt = img.get('alt', '')
@@ -661,33 +1113,36 @@ class UVVNoticiasScraper:
                 
                 if src:
                     if src.startswith('/'):
-                        src = urljoin(self.base_url, src)
+                        src = self._url_absoluta(src)
                     
                     # Filtrar imagens muito pequenas (provavelmente ícones)
                     width = img.get('width')
                     height = img.get('height')
                     
-                    if width and height:
-                        try:
-                            if int(width) < 50 or int(height) < 50:
-                                continue
-                        except ValueError:
-                            pass
+                    # Só dimensões numéricas ("100%", "auto" etc. são ignoradas
+                    # sem passar por int() e ValueError); isdecimal aceita
+                    # exatamente os dígitos que int() converte
+                    if (width and height and width.isdecimal() and height.isdecimal() and
+                            (int(width) < 50 or int(height) < 50)):
+                        continue
                     
                     # Filtrar imagens de logos e ícones comuns
-                    if any(palavra in src.lower() for palavra in ['logo', 'icon', 'favicon', 'button']):
+                    if _IMAGENS_DECORATIVAS_RE.search(src):
                         continue
                     
-                    imagem_info = {
-                        'src': src,
-                        'alt': alt,
-                        'title': title
-                    }
-                    
-                    if imagem_info not in imagens:
-                        imagens.append(imagem_info)
+                    chave_imagem = (src, alt, title)
+                    if chave_imagem not in imagens_vistas:
+                        imagens_vistas.add(chave_imagem)
+                        imagens.append({
+                            'src': src,
+                            'alt': alt,
+                            'title': title
+                        })
+                        # Limite atingido: as demais <img> nem são examinadas
+                        if len(imagens) >= self.MAX_IMAGENS:
+                            break
             
-            conteudo['imagens'] = imagens[:10]  # Limitar a 10 imagens
+            conteudo['imagens'] = imagens
             
             # Extrair vídeos (YouTube, Vimeo, etc.)
             videos = []
@@ -695,7 +1150,7 @@ class UVVNoticiasScraper:
             # iframes de vídeo
             for iframe in soup.find_all('iframe'):
                 src = iframe.get('src', '')
-                if any(plataforma in src.lower() for plataforma in ['youtube', 'vimeo', 'dailymotion']):
+                if _PLATAFORMAS_VIDEO_RE.search(src):
                     videos.append({
                         'src': src,
                         'tipo': 'iframe',
@@ -707,7 +1162,7 @@ class UVVNoticiasScraper:
                 src = video.get('src')
                 if src:
                     if src.startswith('/'):
-                        src = urljoin(self.base_url, src)
+                        src = self._url_absoluta(src)
                     videos.append({
                         'src': src,
                         'tipo': 'video',
@@ -718,34 +1173,45 @@ class UVVNoticiasScraper:
             
             # Extrair links relacionados dentro do conteúdo
             links_relacionados = []
+            links_vistos = set()  # (url, texto) já coletados
             for link in soup.find_all('a', href=True):
                 href = link.get('href')
-                texto_link = link.get_text().strip()
                 
-                # Filtrar apenas links internos da UVV ou links relevantes
-                if (href.startswith('/') or 'uvv.br' in href) and len(texto_link) > 10:
-                    if href.startswith('/'):
-                        href = urljoin(self.base_url, href)
-                    
-                    link_info = {
-                        'url': href,
-                        'texto': texto_link
-                    }
+                # Filtrar apenas links internos da UVV ou links relevantes; o
+                # href é testado antes de extrair o texto da âncora (get_text
+                # percorre a subárvore), e âncoras sem filhos nem têm texto
+                eh_relativo = href.startswith('/')
+                if not (eh_relativo or 'uvv.br' in href) or not link.contents:
+                    continue
+                
+                texto_link = link.get_text().strip()
+                if len(texto_link) > 10:
+                    if eh_relativo:
+                        href = self._url_absoluta(href)
                     
-                    if link_info not in links_relacionados:
-                        links_relacionados.append(link_info)
+                    chave_link = (href, texto_link)
+                    if chave_link not in links_vistos:
+                        links_vistos.add(chave_link)
+                        links_relacionados.append({
+                            'url': href,
+                            'texto': texto_link
+                        })
+                        if len(links_relacionados) >= self.MAX_LINKS_RELACIONADOS:
+                            break
             
-            conteudo['links_relacionados'] = links_relacionados[:5]  # Limitar a 5 links
+            conteudo['links_relacionados'] = links_relacionados
             
-            print(f"✅ Conteúdo extraído: {len(conteudo_texto)} caracteres, {len(imagens)} imagens, {len(videos)} vídeos")
+            logger.info("✅ Conteúdo extraído: %d caracteres, %d imagens, %d vídeos",
+                        len(conteudo_texto), len(imagens), len(videos))
             
             return conteudo
             
         except Exception as e:
-            print(f"❌ Erro ao extrair conteúdo completo de {url_noticia}: {e}")
+            logger.warning("❌ Erro ao extrair conteúdo completo de %s: %s", url_noticia, e)
             return None
     
-    def _eh_linha_menu(self, linha):
+    @staticmethod
+    def _eh_linha_menu(linha):
         """
         Verifica se uma linha de texto parece ser de menu/navegação.
         
@@ -755,23 +1221,12 @@ class UVVNoticiasScraper:
         Returns:
             bool: True se parecer ser linha de menu
         """
-        # Palavras típicas de menu e navegação
-        palavras_menu = [
-            'institucional', 'cpa', 'trabalhe conosco', 'graduação', 'pós graduação',
-            'mestrado', 'doutorado', 'capacitação', 'pesquisa', 'extensão',
-            'serviços', 'comunidade', 'quero abrir', 'saiba mais', 'notícias',
-            'eventos', 'blog', 'contato', 'portal', 'manual', 'diploma',
-            'bolsas', 'financiamentos', 'a uvv', 'cursos', 'residência'
-        ]
-        
-        linha_lower = linha.lower()
-        
         # Verificar se é linha muito curta (típico de menu)
         if len(linha) < 5:
             return True
         
-        # Verificar se contém palavras de menu
-        if any(palavra in linha_lower for palavra in palavras_menu):
+        # Verificar se contém palavras de menu (uma única varredura da linha)
+        if _PALAVRAS_MENU_RE.search(linha):
             return True
         
         # Verificar se é apenas uma palavra ou palavras muito curtas
@@ -781,7 +1236,8 @@ class UVVNoticiasScraper:
         
         return False
     
-    def _eh_texto_navegacao_uvv(self, texto):
+    @staticmethod
+    def _eh_texto_navegacao_uvv(texto):
         """
         Verifica se o texto é específicamente de navegação/menu do site da UVV.
         
@@ -791,63 +1247,47 @@ class UVVNoticiasScraper:
         Returns:
             bool: True se for texto de navegação da UVV
         """
-        # Textos específicos que aparecem na navegação da UVV
-        textos_navegacao_uvv = [
-            'A UVV',
-            'Institucional',
-            'CPA', 
-            'Manual da marca',
-            'Trabalhe conosco',
-            'Cursos',
-            'Graduação',
-            'MBA e Pós Graduação',
-            'Residência',
-            'Mestrado e Doutorado',
-            'Capacitação',
-            'Pesquisa e extensão',
-            'Pesquisa',
-            'Extensão',
-            'Serviços para a comunidade',
-            'Quero abrir um polo',
-            'Saiba mais',
-            'Notícias',
-            'Eventos',
-            'Blog',
-            'Contato',
-            'Portal do Aluno',
-            'Biblioteca',
-            'Webmail'
-        ]
-        
         texto_limpo = texto.strip()
         
-        # Verificar se é exatamente um dos textos de navegação
-        if texto_limpo in textos_navegacao_uvv:
+        # Verificar se é exatamente um dos textos de navegação (sem diferenciar maiúsculas)
+        if texto_limpo.lower() in _TEXTOS_NAVEGACAO_UVV_MINUSCULOS:
             return True
         
-        # Verificar se contém apenas textos de navegação
-        texto_lower = texto_limpo.lower()
-        for nav_text in textos_navegacao_uvv:
-            if nav_text.lower() == texto_lower:
-                return True
-        
         # Verificar se é uma combinação de textos de menu (muito comum no site da UVV)
-        if len(texto_limpo.split('\n')) > 5:
-            linhas = texto_limpo.split('\n')
-            linhas_menu = sum(1 for linha in linhas if linha.strip() in textos_navegacao_uvv)
+        linhas = texto_limpo.split('\n')
+        if len(linhas) > 5:
+            linhas_menu = sum(1 for linha in linhas if linha.strip() in _TEXTOS_NAVEGACAO_UVV)
             if linhas_menu / len(linhas) > 0.7:  # 70% das linhas são de menu
                 return True
         
         return False
     
-    def debug_html_estrutura(self, html_content):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _eh_linha_navegacao(linha):
+        """
+        Filtro único para linhas de conteúdo: menu ou navegação da UVV.
+        
+        Memoizado: as mesmas linhas de menu e rodapé se repetem em todas as
+        páginas de notícia e em cada estratégia de extração da mesma página.
+        
+        Args:
+            linha (str): Linha de texto para verificar
+            
+        Returns:
+            bool: True se a linha deve ser descartada
+        """
+        return (UVVNoticiasScraper._eh_linha_menu(linha) or
+                UVVNoticiasScraper._eh_texto_navegacao_uvv(linha))
+    
+    def debug_html_estrutura(self, html_content, encoding=None):
         """Faz debug da estrutura HTML para entender o layout."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _PARSER_HTML, from_encoding=encoding)
         
         print(f"\n🔍 === DEBUG DA ESTRUTURA HTML ===")
         
         # Procurar por textos que contenham "inova"
-        elementos_inova = soup.find_all(string=re.compile(r'inova', re.IGNORECASE))
+        elementos_inova = soup.find_all(string=_INOVA_RE)
         print(f"📝 Textos contendo 'inova': {len(elementos_inova)}")
         
         for i, texto in enumerate(elementos_inova[:5]):  # Primeiros 5
@@ -890,21 +1330,24 @@ class UVVNoticiasScraper:
         
         total_noticias = 0
         
-        for i, url in enumerate(urls_para_verificar, 1):
+        # Baixar todas as páginas de listagem de uma vez (o ritmo por domínio
+        # continua garantido por fazer_requisicao)
+        with ThreadPoolExecutor(max_workers=self.max_concorrencia) as executor:
+            respostas = list(executor.map(self.fazer_requisicao, urls_para_verificar))
+        
+        for i, (url, response) in enumerate(zip(urls_para_verificar, respostas), 1):
             print(f"\n--- Verificando URL {i}/{len(urls_para_verificar)} ---")
             
-            # Fazer requisição
-            response = self.fazer_requisicao(url)
             if not response:
                 print(f"⚠️ Pulando URL devido a erro: {url}")
                 continue
             
-            # Debug da estrutura HTML na primeira URL
-            if i == 1:
-                self.debug_html_estrutura(response.text)
+            # Debug da estrutura HTML na primeira URL (apenas com debug ativo)
+            if i == 1 and self.debug:
+                self.debug_html_estrutura(response.content, encoding=response.encoding)
             
-            # Extrair notícias da página
-            noticias_pagina = self.extrair_noticias_pagina(response.text, url)
+            # Extrair notícias da página (bytes + encoding: sem decodificar duas vezes)
+            noticias_pagina = self.extrair_noticias_pagina(response.content, url, encoding=response.encoding)
             
             # Não filtrar por data inicialmente, vamos ver tudo que foi capturado
             print(f"📰 Encontradas {len(noticias_pagina)} notícias total")
@@ -912,19 +1355,19 @@ class UVVNoticiasScraper:
             # Adicionar à coleção principal
             self.noticias.extend(noticias_pagina)
             total_noticias += len(noticias_pagina)
-            
-            # Rate limiting apenas se tivermos mais URLs
-            if i < len(urls_para_verificar):
-                print(f"⏳ Aguardando 2s antes da próxima requisição...")
-                time.sleep(2)
         
         # Remover duplicatas baseado no título
         self.remover_duplicatas()
         
+        # Notícias do Inova: baixar o conteúdo completo em paralelo, num único
+        # pool para todas as páginas de listagem e só para as notícias que
+        # sobraram após a deduplicação
+        self.completar_noticias_inova(self.noticias)
+        
         print(f"\n🎉 === COLETA FINALIZADA ===")
         print(f"📊 Total coletado: {len(self.noticias)} notícias únicas")
-        print(f"� Notícias do Inova: {sum(1 for n in self.noticias if n.get('eh_inova'))}")
-        print(f"� Notícias com data: {sum(1 for n in self.noticias if n.get('data_publicacao'))}")
+        print(f"� Notícias do Inova: {sum(1 for n in self.noticias if n.eh_inova)}")
+        print(f"� Notícias com data: {sum(1 for n in self.noticias if n.data_publicacao)}")
         
         return self.noticias
     
@@ -932,19 +1375,14 @@ class UVVNoticiasScraper:
         """Remove notícias duplicadas baseado no título."""
         print(f"🔄 Removendo duplicatas...")
         
-        titulos_vistos = set()
-        noticias_unicas = []
-        duplicatas = 0
-        
+        # Primeira notícia de cada título normalizado; o dict preserva a
+        # ordem de inserção, então a ordem original é mantida
+        por_titulo = {}
         for noticia in self.noticias:
-            titulo_normalizado = noticia['titulo'].lower().strip()
-            if titulo_normalizado not in titulos_vistos:
-                titulos_vistos.add(titulo_normalizado)
-                noticias_unicas.append(noticia)
-            else:
-                duplicatas += 1
+            por_titulo.setdefault(noticia.titulo.lower().strip(), noticia)
         
-        self.noticias = noticias_unicas
+        duplicatas = len(self.noticias) - len(por_titulo)
+        self.noticias = list(por_titulo.values())
         print(f"🗑️ Removidas {duplicatas} duplicatas")
     
     def salvar_resultados(self):
@@ -977,54 +1415,62 @@ class UVVNoticiasScraper:
                 'url_fonte', 'timestamp_coleta'
             ]
             
+            # Estatísticas de qualidade, acumuladas na mesma passada da escrita
+            conteudo_alto = conteudo_medio = conteudo_baixo = 0
+            
             with open(filename, 'w', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
+                # csv.writer com linhas posicionais (na ordem de fieldnames):
+                # sem o dict por linha que o DictWriter remonta em lista
+                writer = csv.writer(file)
+                writer.writerow(fieldnames)
                 
                 for noticia in self.noticias:
-                    conteudo = noticia.get('conteudo_completo', '')
+                    conteudo = noticia.conteudo_completo
+                    tamanho = len(conteudo)
+                    
+                    if conteudo:
+                        if tamanho > 500:
+                            conteudo_alto += 1
+                        elif tamanho >= 200:
+                            conteudo_medio += 1
+                        else:
+                            conteudo_baixo += 1
                     
                     # Calcular qualidade da extração
                     qualidade = 'Baixa'
-                    if len(conteudo) > 500:
+                    if tamanho > 500:
                         qualidade = 'Alta'
-                    elif len(conteudo) > 200:
+                    elif tamanho > 200:
                         qualidade = 'Média'
                     
                     # Verificar se parece ser navegação (baixa qualidade)
                     if conteudo and self._eh_texto_navegacao_uvv(conteudo[:200]):
                         qualidade = 'Menu/Navegação'
                     
-                    # Preparar dados para CSV
-                    row = {
-                        'titulo': noticia.get('titulo', ''),
-                        'resumo': noticia.get('resumo', ''),
-                        'data_publicacao': noticia.get('data_publicacao').strftime('%Y-%m-%d') if noticia.get('data_publicacao') else '',
-                        'data_publicacao_texto': noticia.get('data_publicacao_texto', ''),
-                        'link': noticia.get('link', ''),
-                        'categoria': noticia.get('categoria', ''),
-                        'autor': noticia.get('autor', ''),
-                        'tags': ', '.join(noticia.get('tags', [])),
-                        'eh_inova': noticia.get('eh_inova', False),
-                        'conteudo_completo': conteudo,
-                        'tamanho_conteudo': len(conteudo),
-                        'qualidade_extracao': qualidade,
-                        'num_imagens': len(noticia.get('imagens', [])),
-                        'num_videos': len(noticia.get('videos', [])),
-                        'num_links_relacionados': len(noticia.get('links_relacionados', [])),
-                        'url_fonte': noticia.get('url_fonte', ''),
-                        'timestamp_coleta': noticia.get('timestamp_coleta', '')
-                    }
-                    writer.writerow(row)
+                    # Preparar dados para CSV (mesma ordem de fieldnames)
+                    writer.writerow((
+                        noticia.titulo,
+                        noticia.resumo,
+                        # isoformat() da data (em C) em vez do strftime, mesmo resultado
+                        noticia.data_publicacao.date().isoformat() if noticia.data_publicacao else '',
+                        noticia.data_publicacao_texto,
+                        noticia.link,
+                        noticia.categoria,
+                        noticia.autor,
+                        ', '.join(noticia.tags),
+                        noticia.eh_inova,
+                        conteudo,
+                        tamanho,
+                        qualidade,
+                        len(noticia.imagens),
+                        len(noticia.videos),
+                        len(noticia.links_relacionados),
+                        noticia.url_fonte,
+                        noticia.timestamp_coleta
+                    ))
             
             print(f"💾 CSV salvo: {filename}")
             
-            # Estatísticas de qualidade
-            noticias_com_conteudo = [n for n in self.noticias if n.get('conteudo_completo')]
-            conteudo_alto = sum(1 for n in noticias_com_conteudo if len(n.get('conteudo_completo', '')) > 500)
-            conteudo_medio = sum(1 for n in noticias_com_conteudo if 200 <= len(n.get('conteudo_completo', '')) <= 500)
-            conteudo_baixo = sum(1 for n in noticias_com_conteudo if len(n.get('conteudo_completo', '')) < 200)
-            
             print(f"   📊 Qualidade do conteúdo extraído:")
             print(f"   🟢 Alta qualidade (>500 chars): {conteudo_alto}")
             print(f"   🟡 Média qualidade (200-500 chars): {conteudo_medio}")
@@ -1036,7 +1482,16 @@ class UVVNoticiasScraper:
     def salvar_json(self, filename):
         """Salva notícias em formato JSON."""
         try:
-            # Preparar dados para JSON
+            # Totais do metadata numa única passada pelas notícias
+            noticias_inova = com_conteudo = total_imagens = total_videos = 0
+            for noticia in self.noticias:
+                noticias_inova += noticia.eh_inova
+                com_conteudo += bool(noticia.conteudo_completo)
+                total_imagens += len(noticia.imagens)
+                total_videos += len(noticia.videos)
+            
+            # Preparar dados para JSON (as notícias entram como estão: nenhum
+            # dos dois serializadores precisa de uma cópia em dicts)
             dados_json = {
                 'metadata': {
                     'total_noticias': len(self.noticias),
@@ -1044,22 +1499,23 @@ class UVVNoticiasScraper:
                     'ano_alvo': self.ano_alvo,
                     'timestamp_scraping': self.timestamp_scraping.isoformat(),
                     'url_base': self.base_url,
-                    'noticias_inova': sum(1 for n in self.noticias if n.get('eh_inova')),
-                    'noticias_com_conteudo_completo': sum(1 for n in self.noticias if n.get('conteudo_completo')),
-                    'total_imagens': sum(len(n.get('imagens', [])) for n in self.noticias),
-                    'total_videos': sum(len(n.get('videos', [])) for n in self.noticias)
+                    'noticias_inova': noticias_inova,
+                    'noticias_com_conteudo_completo': com_conteudo,
+                    'total_imagens': total_imagens,
+                    'total_videos': total_videos
                 },
-                'noticias': []
+                'noticias': self.noticias
             }
             
-            for noticia in self.noticias:
-                dados_noticia = noticia.copy()
-                if dados_noticia.get('data_publicacao'):
-                    dados_noticia['data_publicacao'] = dados_noticia['data_publicacao'].isoformat()
-                dados_json['noticias'].append(dados_noticia)
-            
-            with open(filename, 'w', encoding='utf-8') as file:
-                json.dump(dados_json, file, ensure_ascii=False, indent=2)
+            # orjson serializa as instâncias de Noticia (e o datetime, em ISO
+            # 8601) direto em bytes UTF-8; o json padrão escreve em partes,
+            # convertendo cada notícia via _para_json só quando chega nela
+            if orjson is not None:
+                with open(filename, 'wb') as file:
+                    file.write(orjson.dumps(dados_json, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as file:
+                    json.dump(dados_json, file, ensure_ascii=False, indent=2, default=_para_json)
             
             print(f"💾 JSON salvo: {filename}")
             
@@ -1074,85 +1530,120 @@ class UVVNoticiasScraper:
             print("❌ Nenhuma notícia coletada")
             return
         
+        # Todas as contagens numa única passada pelas notícias
+        num_inova = com_data = com_resumo = com_link = com_conteudo = 0
+        total_imagens = total_videos = 0
+        categorias = Counter()
+        autores = Counter()
+        noticias_inova = []  # As 3 primeiras, para o detalhamento
+        
+        for noticia in self.noticias:
+            if noticia.eh_inova:
+                num_inova += 1
+                if len(noticias_inova) < 3:
+                    noticias_inova.append(noticia)
+            com_data += noticia.data_publicacao is not None
+            com_resumo += bool(noticia.resumo)
+            com_link += bool(noticia.link)
+            com_conteudo += bool(noticia.conteudo_completo)
+            total_imagens += len(noticia.imagens)
+            total_videos += len(noticia.videos)
+            if noticia.categoria:
+                categorias[noticia.categoria] += 1
+            if noticia.autor:
+                autores[noticia.autor] += 1
+        
         # Estatísticas gerais
         print(f"📰 Total de notícias: {len(self.noticias)}")
         print(f"📅 Período alvo: setembro/{self.ano_alvo}")
-        print(f"🔬 Notícias do Inova UVV: {sum(1 for n in self.noticias if n.get('eh_inova'))}")
-        
-        # Notícias com data
-        com_data = [n for n in self.noticias if n.get('data_publicacao')]
-        print(f"📅 Notícias com data identificada: {len(com_data)}")
-        
-        # Notícias com resumo
-        com_resumo = [n for n in self.noticias if n.get('resumo')]
-        print(f"📝 Notícias com resumo: {len(com_resumo)}")
-        
-        # Notícias com link
-        com_link = [n for n in self.noticias if n.get('link')]
-        print(f"🔗 Notícias com link: {len(com_link)}")
-        
-        # Notícias com conteúdo completo
-        com_conteudo = [n for n in self.noticias if n.get('conteudo_completo')]
-        print(f"📖 Notícias com conteúdo completo: {len(com_conteudo)}")
+        print(f"🔬 Notícias do Inova UVV: {num_inova}")
+        print(f"📅 Notícias com data identificada: {com_data}")
+        print(f"📝 Notícias com resumo: {com_resumo}")
+        print(f"🔗 Notícias com link: {com_link}")
+        print(f"📖 Notícias com conteúdo completo: {com_conteudo}")
         
         # Estatísticas de mídia
-        total_imagens = sum(len(n.get('imagens', [])) for n in self.noticias)
-        total_videos = sum(len(n.get('videos', [])) for n in self.noticias)
         print(f"🖼️ Total de imagens coletadas: {total_imagens}")
         print(f"🎥 Total de vídeos encontrados: {total_videos}")
         
         # Categorias mais comuns
-        categorias = defaultdict(int)
-        for noticia in self.noticias:
-            if noticia.get('categoria'):
-                categorias[noticia['categoria']] += 1
-        
         if categorias:
             print(f"\n🏷️ Categorias encontradas:")
-            for categoria, count in sorted(categorias.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for categoria, count in categorias.most_common(5):
                 print(f"   • {categoria}: {count} notícias")
         
         # Autores mais ativos
-        autores = defaultdict(int)
-        for noticia in self.noticias:
-            if noticia.get('autor'):
-                autores[noticia['autor']] += 1
-        
         if autores:
             print(f"\n✍️ Autores mais ativos:")
-            for autor, count in sorted(autores.items(), key=lambda x: x[1], reverse=True)[:3]:
+            for autor, count in autores.most_common(3):
                 print(f"   • {autor}: {count} notícias")
         
         # Amostra de títulos
         print(f"\n📋 Amostra de títulos coletados:")
         for i, noticia in enumerate(self.noticias[:5], 1):
-            status = "🔬 INOVA" if noticia.get('eh_inova') else "📰 GERAL"
-            conteudo_status = " ✅" if noticia.get('conteudo_completo') else " ❌"
+            status = "🔬 INOVA" if noticia.eh_inova else "📰 GERAL"
+            conteudo_status = " ✅" if noticia.conteudo_completo else " ❌"
             data_str = ""
-            if noticia.get('data_publicacao'):
-                data_str = f" | {noticia['data_publicacao'].strftime('%d/%m/%Y')}"
-            print(f"   {i}. {status}{conteudo_status} | {noticia['titulo'][:80]}...{data_str}")
+            if noticia.data_publicacao:
+                data_str = f" | {noticia.data_publicacao.strftime('%d/%m/%Y')}"
+            print(f"   {i}. {status}{conteudo_status} | {noticia.titulo[:80]}...{data_str}")
         
         # Notícias Inova com conteúdo completo
-        noticias_inova = [n for n in self.noticias if n.get('eh_inova')]
         if noticias_inova:
             print(f"\n🔬 Detalhes das notícias do InovaWeek:")
-            for i, noticia in enumerate(noticias_inova[:3], 1):
-                conteudo_size = len(noticia.get('conteudo_completo', ''))
-                num_imagens = len(noticia.get('imagens', []))
-                print(f"   {i}. {noticia['titulo'][:60]}...")
+            for i, noticia in enumerate(noticias_inova, 1):
+                conteudo_size = len(noticia.conteudo_completo)
+                num_imagens = len(noticia.imagens)
+                print(f"   {i}. {noticia.titulo[:60]}...")
                 print(f"      📄 Conteúdo: {conteudo_size} caracteres")
                 print(f"      🖼️ Imagens: {num_imagens}")
-                if noticia.get('link'):
-                    print(f"      🔗 Link: {noticia['link']}")
+                if noticia.link:
+                    print(f"      🔗 Link: {noticia.link}")
         
         print(f"\n🕐 Scraping finalizado em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
 
+def configurar_logging(nivel=None):
+    """
+    Configura o logging do scraper com emissão em thread separada.
+    
+    Os registros vão para uma fila (QueueHandler) e são escritos no stdout
+    por um QueueListener em segundo plano, tirando a escrita do caminho das
+    threads que baixam as páginas.
+    
+    Args:
+        nivel (int or str): Nível mínimo de log (padrão: variável de ambiente
+            LOG_LEVEL, ou INFO se não definida)
+        
+    Returns:
+        QueueListener: Listener iniciado (chamar .stop() ao final para esvaziar a fila)
+    """
+    if nivel is None:
+        nivel = os.getenv('LOG_LEVEL', 'INFO').upper()
+    
+    fila = queue.Queue(-1)
+    
+    handler_console = logging.StreamHandler(sys.stdout)
+    handler_console.setFormatter(logging.Formatter('%(message)s'))
+    
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(fila)]
+    root.setLevel(nivel)
+    
+    # O DEBUG do urllib3 repete cada conexão; manter só avisos
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    
+    listener = QueueListener(fila, handler_console)
+    listener.start()
+    return listener
+
+
 def executar_scraping_uvv():
     """Função principal para executar o scraping da UVV."""
     print("🎓 === SCRAPER UVV - NOTÍCIAS SETEMBRO 2025 ===")
     print("=" * 55)
     
+    listener_log = configurar_logging()
+    
     # Criar instância do scraper
     scraper = UVVNoticiasScraper()
     
@@ -1179,6 +1670,10 @@ def executar_scraping_uvv():
         if scraper.noticias:
             print(f"💾 Salvando {len(scraper.noticias)} notícias coletadas até o erro...")
             scraper.salvar_resultados()
+    
+    finally:
+        # Esvaziar a fila de log antes de sair
+        listener_log.stop()
 
 if __name__ == "__main__":
     # Executar scraping da UVV
@@ -0,0 +1,12 @@
+"""
+Configuração comum dos testes
+============================
+
+Coloca src/ no path, como fazem os exemplos em src/examples, para que os
+scrapers sejam importados como ``scrapers.<modulo>``.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,176 @@
+"""
+Testes do scraper InovaWeek UVV (scraper_uvv_inovaweek_revisado.py)
+===================================================================
+
+Sem acesso à rede: as respostas HTTP são montadas localmente e os métodos
+que fariam requisições são substituídos com monkeypatch.
+"""
+
+import asyncio
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+from scrapers import scraper_uvv_inovaweek_revisado as inovaweek
+from scrapers.scraper_uvv_inovaweek_revisado import UVVInovaWeekScraper
+
+
+HTML_PAGINACAO = (
+    '<html><body>'
+    '<nav><a href="/noticias/page/2/">2</a><a href="/noticias/page/7/">7</a></nav>'
+    '<div class="pagination"><a href="?page=3">3</a><a href="/x">x</a></div>'
+    '<a href="/foo/pagex">y</a>'
+    '</body></html>'
+)
+
+
+def _resposta(html, encoding='utf-8'):
+    """Monta uma requests.Response com o corpo já em memória."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = html.encode(encoding)
+    response.encoding = encoding
+    return response
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Scraper sem cache em disco, com saída de arquivos num diretório temporário."""
+    monkeypatch.chdir(tmp_path)
+    return UVVInovaWeekScraper(use_cache=False)
+
+
+# === PAGINAÇÃO ===
+
+@pytest.mark.parametrize('href, numero', [
+    ('/noticias/page/2/', 2),
+    ('https://www.uvv.br/noticias/page/15', 15),
+    ('?page=3', 3),
+    ('/noticias/?s=inova&page=4', 4),
+])
+def test_numero_pagina_re_extrai_numero(href, numero):
+    match = inovaweek._NUMERO_PAGINA_RE.search(href)
+    assert match and int(match.group(1)) == numero
+
+
+@pytest.mark.parametrize('href', ['/foo/pagex', '/noticias/page/', '/pages/2', '/x'])
+def test_numero_pagina_re_ignora_links_sem_numero(href):
+    assert inovaweek._NUMERO_PAGINA_RE.search(href) is None
+
+
+def test_strainer_paginacao_mantem_so_links_numerados():
+    soup = BeautifulSoup(HTML_PAGINACAO, inovaweek._PARSER_HTML,
+                         parse_only=inovaweek._PAGINACAO_STRAINER)
+    hrefs = [a['href'] for a in soup.find_all('a')]
+    assert hrefs == ['/noticias/page/2/', '/noticias/page/7/', '?page=3']
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'iso-8859-1'])
+@pytest.mark.parametrize('usar_selectolax', [False, True])
+def test_verificar_paginacao_disponivel(scraper, monkeypatch, usar_selectolax, encoding):
+    if usar_selectolax:
+        if inovaweek.LexborHTMLParser is None:
+            pytest.skip('selectolax não instalado')
+    else:
+        monkeypatch.setattr(inovaweek, 'LexborHTMLParser', None)
+    
+    monkeypatch.setattr(scraper, 'fazer_requisicao', lambda url: _resposta(HTML_PAGINACAO, encoding))
+    sondadas = []
+    
+    def sondar(numero_pagina):
+        sondadas.append(numero_pagina)
+        return 'ok'
+    
+    monkeypatch.setattr(scraper, '_sondar_pagina', sondar)
+    
+    # Maior página nos links: 7; só as páginas 2 a 5 são sondadas
+    assert scraper.verificar_paginacao_disponivel() == 7
+    assert sorted(sondadas) == [2, 3, 4, 5]
+
+
+# === EXTRAÇÃO CONCORRENTE E CHECKPOINT ===
+
+@pytest.fixture(params=['orjson', 'json'])
+def serializador(request, monkeypatch):
+    """Roda o teste com orjson (quando instalado) e com o json padrão."""
+    if request.param == 'orjson':
+        if inovaweek.orjson is None:
+            pytest.skip('orjson não instalado')
+    else:
+        monkeypatch.setattr(inovaweek, 'orjson', None)
+    return request.param
+
+
+def _noticias(links):
+    return [{'titulo': f'Notícia {i}', 'link': link} for i, link in enumerate(links)]
+
+
+def test_processamento_concorrente_grava_e_retoma_checkpoint(scraper, monkeypatch, tmp_path, serializador):
+    links = [f'https://www.uvv.br/noticias/inovaweek-{i}' for i in range(8)]
+    checkpoint = str(tmp_path / 'checkpoint.jsonl')
+    chamadas = []
+    
+    def processar(link):
+        chamadas.append(link)
+        if link.endswith('-3'):
+            raise requests.exceptions.ConnectionError('falha simulada')
+        return {'conteudo_completo': f'Conteúdo de {link} — ação', 'autor': 'UVV'}
+    
+    monkeypatch.setattr(scraper, 'processar_noticia_individual', processar)
+    
+    # Link repetido entre páginas é buscado uma única vez
+    noticias = _noticias(links + [links[0]])
+    scraper._processar_noticias_concorrente(noticias, checkpoint)
+    
+    assert sorted(chamadas) == sorted(links)
+    assert noticias[-1]['conteudo_completo'] == noticias[0]['conteudo_completo']
+    assert noticias[3]['conteudo_completo'] == ''
+    assert 'falha simulada' in noticias[3]['erro']
+    
+    # Só os sucessos entram no checkpoint, um registro completo por linha
+    salvos = UVVInovaWeekScraper._carregar_checkpoint(checkpoint)
+    assert set(salvos) == set(links) - {links[3]}
+    assert salvos[links[5]] == {'conteudo_completo': f'Conteúdo de {links[5]} — ação', 'autor': 'UVV'}
+    
+    # Retomada: apenas a notícia que falhou é buscada de novo
+    chamadas.clear()
+    monkeypatch.setattr(scraper, 'processar_noticia_individual',
+                        lambda link: chamadas.append(link) or {'conteudo_completo': 'ok'})
+    noticias = _noticias(links)
+    scraper._processar_noticias_concorrente(noticias, checkpoint)
+    
+    assert chamadas == [links[3]]
+    assert noticias[3] == {'titulo': 'Notícia 3', 'link': links[3], 'conteudo_completo': 'ok'}
+    assert noticias[0]['conteudo_completo'] == f'Conteúdo de {links[0]} — ação'
+    assert set(UVVInovaWeekScraper._carregar_checkpoint(checkpoint)) == set(links)
+
+
+def test_processamento_concorrente_dentro_de_event_loop(scraper, monkeypatch):
+    # Chamado de código assíncrono (Jupyter, frameworks async) não pode
+    # depender de asyncio.run
+    monkeypatch.setattr(scraper, 'processar_noticia_individual',
+                        lambda link: {'conteudo_completo': link})
+    noticias = _noticias(['https://a', 'https://b'])
+    
+    async def chamar():
+        scraper._processar_noticias_concorrente(noticias)
+    
+    asyncio.run(chamar())
+    assert [n['conteudo_completo'] for n in noticias] == ['https://a', 'https://b']
+
+
+def test_carregar_checkpoint_ignora_linha_truncada(tmp_path, serializador):
+    checkpoint = tmp_path / 'checkpoint.jsonl'
+    checkpoint.write_bytes(
+        '{"url": "https://a", "dados": {"conteudo_completo": "ação"}}\n'
+        '{"url": "https://b", "dados": {"conteudo_'.encode('utf-8')
+    )
+    
+    assert UVVInovaWeekScraper._carregar_checkpoint(str(checkpoint)) == {
+        'https://a': {'conteudo_completo': 'ação'}
+    }
+
+
+def test_carregar_checkpoint_inexistente(tmp_path):
+    assert UVVInovaWeekScraper._carregar_checkpoint(str(tmp_path / 'nao_existe.jsonl')) == {}
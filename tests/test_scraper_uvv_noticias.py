@@ -0,0 +1,194 @@
+"""
+Testes do scraper de notícias UVV (scraper_uvv_noticias.py)
+===========================================================
+
+Sem acesso à rede: a listagem é montada localmente e processada com os dois
+parsers suportados (BeautifulSoup e selectolax), que devem concordar.
+"""
+
+from datetime import datetime
+from urllib.parse import urljoin
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import scraper_uvv_noticias as uvv
+from scrapers.scraper_uvv_noticias import UVVNoticiasScraper
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Scraper sem cache HTTP, com saída de arquivos num diretório temporário."""
+    monkeypatch.chdir(tmp_path)
+    return UVVNoticiasScraper(usar_cache=False)
+
+
+@pytest.fixture(params=['beautifulsoup', 'selectolax'])
+def parser(request, monkeypatch):
+    """Roda o teste com cada parser da listagem."""
+    if request.param == 'selectolax':
+        if uvv.LexborHTMLParser is None:
+            pytest.skip('selectolax não instalado')
+    else:
+        monkeypatch.setattr(uvv, 'LexborHTMLParser', None)
+    return request.param
+
+
+# === DATAS ===
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('15/09/2025', datetime(2025, 9, 15)),
+    ('5-9-2025', datetime(2025, 9, 5)),
+    ('15.09.2025', datetime(2025, 9, 15)),
+    ('2025-09-15', datetime(2025, 9, 15)),
+    ('Publicado em 2025-09-03T10:00', datetime(2025, 9, 3)),
+    ('15 de setembro de 2025', datetime(2025, 9, 15)),
+    ('3 DE Agosto DE 2025', datetime(2025, 8, 3)),
+    ('Setembro de 2025', datetime(2025, 9, 1)),
+])
+def test_parse_data_texto_formatos(texto, esperado):
+    assert uvv._parse_data_texto(texto) == esperado
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    # Dia explícito tem precedência sobre "setembro de yyyy" no mesmo trecho
+    ('Aula em 20 de setembro de 2025', datetime(2025, 9, 20)),
+    # Vale a data que aparece primeiro no texto, qualquer que seja o formato
+    ('Publicado em 03/09/2025, atualizado em 2025-09-20', datetime(2025, 9, 3)),
+    ('Evento de setembro de 2025 - inscrições até 10/08/2025', datetime(2025, 9, 1)),
+    # Data inválida é descartada e a busca continua
+    ('31/02/2025 (adiado para 10/09/2025)', datetime(2025, 9, 10)),
+    ('2025-13-01 ou 2025-09-02', datetime(2025, 9, 2)),
+])
+def test_parse_data_texto_precedencia(texto, esperado):
+    assert uvv._parse_data_texto(texto) == esperado
+
+
+@pytest.mark.parametrize('texto', ['', 'InovaWeek 2025', '12 de inovação de 2025', '2025/09/15'])
+def test_parse_data_texto_sem_data(texto):
+    assert uvv._parse_data_texto(texto) is None
+
+
+# === CONSULTAS CSS (BeautifulSoup x selectolax) ===
+
+HTML_CARD = (
+    '<html><body>'
+    '<div class="card" data-date="2025-08-01T10:00:00">'
+    '<div class="card"><h3><a href="/noticias/interna">Notícia interna</a></h3></div>'
+    '<time datetime="2025-09-15T10:00:00"></time>'
+    '</div>'
+    '</body></html>'
+)
+
+
+def _raiz(html):
+    """Árvore montada por _parse_listagem com o parser ativo."""
+    return UVVNoticiasScraper._parse_listagem(None, html)
+
+
+def test_parse_listagem_usa_parser_ativo(parser):
+    raiz = _raiz(HTML_CARD)
+    if parser == 'selectolax':
+        assert isinstance(raiz, uvv.LexborHTMLParser)
+    else:
+        assert isinstance(raiz, BeautifulSoup)
+
+
+def test_buscar_considera_apenas_descendentes(parser):
+    # Como no select/select_one do BeautifulSoup, o próprio nó não entra
+    # no resultado mesmo quando casa com o seletor
+    card = uvv._buscar_no(_raiz(HTML_CARD), 'div.card')
+    
+    assert uvv._attr_no(card, 'data-date') == '2025-08-01T10:00:00'
+    assert uvv._attr_no(uvv._buscar_no(card, '.card'), 'data-date') is None
+    assert len(uvv._buscar_todos(card, 'div')) == 1
+    assert uvv._buscar_no(card, '[data-date]') is None
+    assert uvv._attr_no(uvv._buscar_no(card, UVVNoticiasScraper.SELETOR_ATRIBUTOS_DATA),
+                        'datetime') == '2025-09-15T10:00:00'
+
+
+def test_buscar_na_raiz_inclui_todos(parser):
+    raiz = _raiz(HTML_CARD)
+    assert len(uvv._buscar_todos(raiz, 'div.card')) == 2
+    assert uvv._texto_no(uvv._buscar_no(raiz, 'h3 a')) == 'Notícia interna'
+
+
+HTML_LISTAGEM = '''
+<html><body>
+<nav class="menu"><a href="/cursos">Cursos de graduação e pós-graduação</a></nav>
+<div class="row">
+  <div class="col-md-3">
+    <div class="card">
+      <img src="/img/inova.jpg">
+      <h3><a href="/noticias/inovaweek-2025">InovaWeek 2025 reúne startups da UVV</a></h3>
+      <p>Evento de inovação e empreendedorismo movimenta o campus em setembro.</p>
+      <time datetime="2025-09-15T10:00:00"></time>
+    </div>
+  </div>
+  <article class="post">
+    <h2>Semana de pesquisa científica</h2>
+    <a href="https://www.uvv.br/noticias/pesquisa">Leia mais</a>
+    <span class="date">22 de setembro de 2025</span>
+  </article>
+  <div class="noticia">
+    <h2>Calendário acadêmico de agosto</h2>
+    <span class="data">05/08/2025</span>
+  </div>
+</div>
+</body></html>
+'''
+
+
+def _resumo(noticias):
+    return [(n.titulo, n.link, n.data_publicacao, n.eh_inova) for n in noticias]
+
+
+def test_extrair_noticias_pagina(scraper, parser):
+    noticias = scraper.extrair_noticias_pagina(HTML_LISTAGEM.encode('utf-8'),
+                                               scraper.noticias_url, encoding='utf-8')
+    
+    # A coluna e o card dentro dela viram a mesma notícia (deduplicada depois
+    # por remover_duplicatas); a notícia de agosto fora do Inova é descartada
+    assert set(_resumo(noticias)) == {
+        ('InovaWeek 2025 reúne startups da UVV', 'https://www.uvv.br/noticias/inovaweek-2025',
+         datetime(2025, 9, 15, 10, 0), True),
+        ('Semana de pesquisa científica', 'https://www.uvv.br/noticias/pesquisa',
+         datetime(2025, 9, 22), True),
+    }
+
+
+def test_extrair_noticias_pagina_mesmo_resultado_nos_dois_parsers(scraper, monkeypatch):
+    if uvv.LexborHTMLParser is None:
+        pytest.skip('selectolax não instalado')
+    
+    com_selectolax = scraper.extrair_noticias_pagina(HTML_LISTAGEM, scraper.noticias_url)
+    monkeypatch.setattr(uvv, 'LexborHTMLParser', None)
+    com_beautifulsoup = scraper.extrair_noticias_pagina(HTML_LISTAGEM, scraper.noticias_url)
+    
+    assert _resumo(com_selectolax) == _resumo(com_beautifulsoup)
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'UTF8', 'iso-8859-1', 'cp1252'])
+def test_extrair_noticias_pagina_bytes_com_encoding(scraper, parser, encoding):
+    # Bytes + encoding da resposta dão o mesmo resultado que o texto já
+    # decodificado (UTF-8 vai direto ao lexbor; os demais são decodificados)
+    esperado = _resumo(scraper.extrair_noticias_pagina(HTML_LISTAGEM, scraper.noticias_url))
+    noticias = scraper.extrair_noticias_pagina(HTML_LISTAGEM.encode(encoding),
+                                               scraper.noticias_url, encoding=encoding)
+    
+    assert _resumo(noticias) == esperado
+
+
+# === URLS ===
+
+@pytest.mark.parametrize('caminho', [
+    '/noticias/inovaweek-2025',
+    '/',
+    '/noticias/?page=2&s=inova',
+    '/img/foto.jpg#topo',
+    '//cdn.uvv.br/img/foto.jpg',
+    '/noticias/../eventos/./inova',
+    '/noticias/.well-known',
+])
+def test_url_absoluta_igual_urljoin(scraper, caminho):
+    assert scraper._url_absoluta(caminho) == urljoin(scraper.base_url, caminho)